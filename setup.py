@@ -0,0 +1,36 @@
+"""
+Build hook for the optional compiled front end.
+
+A normal `pip install .` ships prose as pure Python; project metadata lives
+in pyproject.toml. To also compile the lexer, the parser and the AST node
+classes with Cython, install Cython and build with PROSE_COMPILE=1:
+
+    pip install cython
+    PROSE_COMPILE=1 pip install --no-build-isolation .
+
+The .py sources are always installed alongside, so a build without Cython
+(or a platform without a compiler) still works; Python simply imports the
+extension module when one is present.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("PROSE_COMPILE"):
+    from Cython.Build import cythonize
+
+    directives = {"language_level": "3"}
+    ext_modules = cythonize(
+        ["src/prose_lang/lexer.py", "src/prose_lang/parser.py"],
+        compiler_directives=directives,
+    )
+    # Node fields are annotated loosely (e.g. `name: str = None`), so Cython
+    # must not turn those annotations into argument type checks.
+    ext_modules += cythonize(
+        ["src/prose_lang/_ast_nodes.py"],
+        compiler_directives={**directives, "annotation_typing": False},
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,1474 @@
+# Generated by tools/gen_ast_nodes.py from tools/ast_spec.py — do not edit.
+"""
+prose AST node classes.
+
+Plain classes equivalent to the @dataclass declarations in
+tools/ast_spec.py, written out ahead of time so importing the parser does
+not run the dataclass code generator.
+"""
+
+from __future__ import annotations
+from typing import Any, List, Optional
+
+__all__ = [
+    'NumberLiteral',
+    'StringLiteral',
+    'BoolLiteral',
+    'NoneLiteral',
+    'LiteralNode',
+    'Identifier',
+    'BinOp',
+    'UnaryMinus',
+    'CompoundCondition',
+    'Condition',
+    'ListLiteral',
+    'ListAccess',
+    'LengthOf',
+    'UppercaseOf',
+    'LowercaseOf',
+    'ContainsExpr',
+    'JoinWith',
+    'TypeCheck',
+    'ReplaceIn',
+    'SplitBy',
+    'TrimOf',
+    'RepeatStr',
+    'ListContainsExpr',
+    'SortList',
+    'IndexOf',
+    'RoundOf',
+    'AbsOf',
+    'RandomBetween',
+    'MinOf',
+    'MaxOf',
+    'SqrtOf',
+    'FloorOf',
+    'CeilingOf',
+    'PowerOf',
+    'AsNumber',
+    'AsText',
+    'TryCatch',
+    'DictLiteral',
+    'DictAccess',
+    'DictHasKey',
+    'DictKeys',
+    'SetDictValueStmt',
+    'RemoveDictValueStmt',
+    'FileContents',
+    'FileExists',
+    'WriteFileStmt',
+    'AppendFileStmt',
+    'ImportStmt',
+    'ThrowStmt',
+    'JsonParseExpr',
+    'JsonStringifyExpr',
+    'ParamDef',
+    'HttpGetExpr',
+    'HttpPostExpr',
+    'ClassDef',
+    'MethodDef',
+    'NewInstanceExpr',
+    'PropertyAccessExpr',
+    'SetPropertyStmt',
+    'MethodCallStmt',
+    'TimeOp',
+    'InterpolatedString',
+    'CheckStmt',
+    'LambdaExpr',
+    'BlockLambda',
+    'MapExpr',
+    'FilterExpr',
+    'EnumDef',
+    'AttemptStmt',
+    'WaitExpr',
+    'RangeLoopStmt',
+    'AllWhereExpr',
+    'WhenStmt',
+    'CreateWindowStmt',
+    'AddWidgetStmt',
+    'RunWindowStmt',
+    'SetTextStmt',
+    'EnumAccess',
+    'CliArgsExpr',
+    'EnvVarExpr',
+    'TestBlock',
+    'AssertStmt',
+    'RunTestsStmt',
+    'RegexMatchExpr',
+    'RegexTestExpr',
+    'StringIndexExpr',
+    'StringSliceExpr',
+    'LetStmt',
+    'DisplayStmt',
+    'SayStmt',
+    'AskStmt',
+    'IfStmt',
+    'RepeatStmt',
+    'WhileStmt',
+    'ForEachStmt',
+    'FunctionDef',
+    'CallStmt',
+    'LetResultStmt',
+    'GiveBackStmt',
+    'AddToListStmt',
+    'RemoveFromListStmt',
+    'StopStmt',
+    'SkipStmt',
+    'NODE_TYPES',
+]
+
+
+class _Record:
+    """Field-wise repr and equality over _fields, as @dataclass provides."""
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __repr__(self):
+        args = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__qualname__}({args})"
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return (tuple(getattr(self, f) for f in self._fields)
+                    == tuple(getattr(other, f) for f in other._fields))
+        return NotImplemented
+
+
+class _Node(_Record):
+    """Base of every AST node; node_kind indexes NODE_TYPES."""
+    __slots__ = ("line",)
+    node_kind: int = -1
+
+
+class NumberLiteral(_Node):
+    node_kind = 0
+    __slots__ = ('value',)
+    _fields = ('line', 'value')
+    __match_args__ = ('value',)
+
+    def __init__(self, value: float, line: int = 0):
+        self.line = line
+        self.value = value
+
+
+class StringLiteral(_Node):
+    node_kind = 1
+    __slots__ = ('value',)
+    _fields = ('line', 'value')
+    __match_args__ = ('value',)
+
+    def __init__(self, value: str, line: int = 0):
+        self.line = line
+        self.value = value
+
+
+class BoolLiteral(_Node):
+    node_kind = 2
+    __slots__ = ('value',)
+    _fields = ('line', 'value')
+    __match_args__ = ('value',)
+
+    def __init__(self, value: bool, line: int = 0):
+        self.line = line
+        self.value = value
+
+
+class NoneLiteral(_Node):
+    node_kind = 3
+    __slots__ = ()
+    _fields = ('line',)
+    __match_args__ = ()
+
+    def __init__(self, line: int = 0):
+        self.line = line
+
+
+class LiteralNode(_Node):
+    node_kind = 4
+    __slots__ = ('value',)
+    _fields = ('line', 'value')
+    __match_args__ = ('value',)
+
+    def __init__(self, value: Any, line: int = 0):
+        self.line = line
+        self.value = value
+
+
+class Identifier(_Node):
+    node_kind = 5
+    __slots__ = ('name',)
+    _fields = ('line', 'name')
+    __match_args__ = ('name',)
+
+    def __init__(self, name: str, line: int = 0):
+        self.line = line
+        self.name = name
+
+
+class BinOp(_Node):
+    node_kind = 6
+    __slots__ = ('left', 'op', 'right')
+    _fields = ('line', 'left', 'op', 'right')
+    __match_args__ = ('left', 'op', 'right')
+
+    def __init__(self, left: Any, op: str, right: Any, line: int = 0):
+        self.line = line
+        self.left = left
+        self.op = op
+        self.right = right
+
+
+class UnaryMinus(_Node):
+    node_kind = 7
+    __slots__ = ('operand',)
+    _fields = ('line', 'operand')
+    __match_args__ = ('operand',)
+
+    def __init__(self, operand: Any, line: int = 0):
+        self.line = line
+        self.operand = operand
+
+
+class CompoundCondition(_Node):
+    node_kind = 8
+    __slots__ = ('connective', 'operands')
+    _fields = ('line', 'connective', 'operands')
+    __match_args__ = ('connective', 'operands')
+
+    def __init__(self, connective: str, operands: List[Any], line: int = 0):
+        self.line = line
+        self.connective = connective
+        self.operands = operands
+
+
+class Condition(_Node):
+    node_kind = 9
+    __slots__ = ('left', 'op', 'right')
+    _fields = ('line', 'left', 'op', 'right')
+    __match_args__ = ('left', 'op', 'right')
+
+    def __init__(self, left: Any, op: str, right: Any, line: int = 0):
+        self.line = line
+        self.left = left
+        self.op = op
+        self.right = right
+
+
+class ListLiteral(_Node):
+    node_kind = 10
+    __slots__ = ('elements',)
+    _fields = ('line', 'elements')
+    __match_args__ = ('elements',)
+
+    def __init__(self, elements: List[Any], line: int = 0):
+        self.line = line
+        self.elements = elements
+
+
+class ListAccess(_Node):
+    node_kind = 11
+    __slots__ = ('list_expr', 'index_expr')
+    _fields = ('line', 'list_expr', 'index_expr')
+    __match_args__ = ('list_expr', 'index_expr')
+
+    def __init__(self, list_expr: Any, index_expr: Any, line: int = 0):
+        self.line = line
+        self.list_expr = list_expr
+        self.index_expr = index_expr
+
+
+class LengthOf(_Node):
+    node_kind = 12
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class UppercaseOf(_Node):
+    node_kind = 13
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class LowercaseOf(_Node):
+    node_kind = 14
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class ContainsExpr(_Node):
+    node_kind = 15
+    __slots__ = ('haystack', 'needle')
+    _fields = ('line', 'haystack', 'needle')
+    __match_args__ = ('haystack', 'needle')
+
+    def __init__(self, haystack: Any, needle: Any, line: int = 0):
+        self.line = line
+        self.haystack = haystack
+        self.needle = needle
+
+
+class JoinWith(_Node):
+    node_kind = 16
+    __slots__ = ('list_expr', 'separator')
+    _fields = ('line', 'list_expr', 'separator')
+    __match_args__ = ('list_expr', 'separator')
+
+    def __init__(self, list_expr: Any, separator: Any, line: int = 0):
+        self.line = line
+        self.list_expr = list_expr
+        self.separator = separator
+
+
+class TypeCheck(_Node):
+    node_kind = 17
+    __slots__ = ('expr', 'expected')
+    _fields = ('line', 'expr', 'expected')
+    __match_args__ = ('expr', 'expected')
+
+    def __init__(self, expr: Any, expected: str, line: int = 0):
+        self.line = line
+        self.expr = expr
+        self.expected = expected
+
+
+class ReplaceIn(_Node):
+    node_kind = 18
+    __slots__ = ('source', 'find', 'replacement')
+    _fields = ('line', 'source', 'find', 'replacement')
+    __match_args__ = ('source', 'find', 'replacement')
+
+    def __init__(self, source: Any, find: Any, replacement: Any, line: int = 0):
+        self.line = line
+        self.source = source
+        self.find = find
+        self.replacement = replacement
+
+
+class SplitBy(_Node):
+    node_kind = 19
+    __slots__ = ('source', 'delimiter')
+    _fields = ('line', 'source', 'delimiter')
+    __match_args__ = ('source', 'delimiter')
+
+    def __init__(self, source: Any, delimiter: Any, line: int = 0):
+        self.line = line
+        self.source = source
+        self.delimiter = delimiter
+
+
+class TrimOf(_Node):
+    node_kind = 20
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class RepeatStr(_Node):
+    node_kind = 21
+    __slots__ = ('expr', 'count')
+    _fields = ('line', 'expr', 'count')
+    __match_args__ = ('expr', 'count')
+
+    def __init__(self, expr: Any, count: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+        self.count = count
+
+
+class ListContainsExpr(_Node):
+    node_kind = 22
+    __slots__ = ('list_expr', 'item')
+    _fields = ('line', 'list_expr', 'item')
+    __match_args__ = ('list_expr', 'item')
+
+    def __init__(self, list_expr: Any, item: Any, line: int = 0):
+        self.line = line
+        self.list_expr = list_expr
+        self.item = item
+
+
+class SortList(_Node):
+    node_kind = 23
+    __slots__ = ('list_name',)
+    _fields = ('line', 'list_name')
+    __match_args__ = ('list_name',)
+
+    def __init__(self, list_name: str, line: int = 0):
+        self.line = line
+        self.list_name = list_name
+
+
+class IndexOf(_Node):
+    node_kind = 24
+    __slots__ = ('item', 'list_expr')
+    _fields = ('line', 'item', 'list_expr')
+    __match_args__ = ('item', 'list_expr')
+
+    def __init__(self, item: Any, list_expr: Any, line: int = 0):
+        self.line = line
+        self.item = item
+        self.list_expr = list_expr
+
+
+class RoundOf(_Node):
+    node_kind = 25
+    __slots__ = ('expr', 'places')
+    _fields = ('line', 'expr', 'places')
+    __match_args__ = ('expr', 'places')
+
+    def __init__(self, expr: Any, places: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+        self.places = places
+
+
+class AbsOf(_Node):
+    node_kind = 26
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class RandomBetween(_Node):
+    node_kind = 27
+    __slots__ = ('low', 'high')
+    _fields = ('line', 'low', 'high')
+    __match_args__ = ('low', 'high')
+
+    def __init__(self, low: Any, high: Any, line: int = 0):
+        self.line = line
+        self.low = low
+        self.high = high
+
+
+class MinOf(_Node):
+    node_kind = 28
+    __slots__ = ('left', 'right')
+    _fields = ('line', 'left', 'right')
+    __match_args__ = ('left', 'right')
+
+    def __init__(self, left: Any, right: Any, line: int = 0):
+        self.line = line
+        self.left = left
+        self.right = right
+
+
+class MaxOf(_Node):
+    node_kind = 29
+    __slots__ = ('left', 'right')
+    _fields = ('line', 'left', 'right')
+    __match_args__ = ('left', 'right')
+
+    def __init__(self, left: Any, right: Any, line: int = 0):
+        self.line = line
+        self.left = left
+        self.right = right
+
+
+class SqrtOf(_Node):
+    node_kind = 30
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class FloorOf(_Node):
+    node_kind = 31
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class CeilingOf(_Node):
+    node_kind = 32
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class PowerOf(_Node):
+    node_kind = 33
+    __slots__ = ('base', 'exp')
+    _fields = ('line', 'base', 'exp')
+    __match_args__ = ('base', 'exp')
+
+    def __init__(self, base: Any, exp: Any, line: int = 0):
+        self.line = line
+        self.base = base
+        self.exp = exp
+
+
+class AsNumber(_Node):
+    node_kind = 34
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class AsText(_Node):
+    node_kind = 35
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class TryCatch(_Node):
+    node_kind = 36
+    __slots__ = ('try_body', 'error_var', 'catch_body')
+    _fields = ('line', 'try_body', 'error_var', 'catch_body')
+    __match_args__ = ('try_body', 'error_var', 'catch_body')
+
+    def __init__(self, try_body: List[Any], error_var: str, catch_body: List[Any], line: int = 0):
+        self.line = line
+        self.try_body = try_body
+        self.error_var = error_var
+        self.catch_body = catch_body
+
+
+class DictLiteral(_Node):
+    node_kind = 37
+    __slots__ = ('pairs',)
+    _fields = ('line', 'pairs')
+    __match_args__ = ('pairs',)
+
+    def __init__(self, pairs: List[tuple[Any, Any]], line: int = 0):
+        self.line = line
+        self.pairs = pairs
+
+
+class DictAccess(_Node):
+    node_kind = 38
+    __slots__ = ('dict_expr', 'key_expr')
+    _fields = ('line', 'dict_expr', 'key_expr')
+    __match_args__ = ('dict_expr', 'key_expr')
+
+    def __init__(self, dict_expr: Any, key_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+        self.key_expr = key_expr
+
+
+class DictHasKey(_Node):
+    node_kind = 39
+    __slots__ = ('dict_expr', 'key_expr')
+    _fields = ('line', 'dict_expr', 'key_expr')
+    __match_args__ = ('dict_expr', 'key_expr')
+
+    def __init__(self, dict_expr: Any, key_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+        self.key_expr = key_expr
+
+
+class DictKeys(_Node):
+    node_kind = 40
+    __slots__ = ('dict_expr',)
+    _fields = ('line', 'dict_expr')
+    __match_args__ = ('dict_expr',)
+
+    def __init__(self, dict_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+
+
+class SetDictValueStmt(_Node):
+    node_kind = 41
+    __slots__ = ('dict_expr', 'key_expr', 'value_expr')
+    _fields = ('line', 'dict_expr', 'key_expr', 'value_expr')
+    __match_args__ = ('dict_expr', 'key_expr', 'value_expr')
+
+    def __init__(self, dict_expr: Any, key_expr: Any, value_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+        self.key_expr = key_expr
+        self.value_expr = value_expr
+
+
+class RemoveDictValueStmt(_Node):
+    node_kind = 42
+    __slots__ = ('dict_expr', 'key_expr')
+    _fields = ('line', 'dict_expr', 'key_expr')
+    __match_args__ = ('dict_expr', 'key_expr')
+
+    def __init__(self, dict_expr: Any, key_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+        self.key_expr = key_expr
+
+
+class FileContents(_Node):
+    node_kind = 43
+    __slots__ = ('file_expr',)
+    _fields = ('line', 'file_expr')
+    __match_args__ = ('file_expr',)
+
+    def __init__(self, file_expr: Any, line: int = 0):
+        self.line = line
+        self.file_expr = file_expr
+
+
+class FileExists(_Node):
+    node_kind = 44
+    __slots__ = ('file_expr',)
+    _fields = ('line', 'file_expr')
+    __match_args__ = ('file_expr',)
+
+    def __init__(self, file_expr: Any, line: int = 0):
+        self.line = line
+        self.file_expr = file_expr
+
+
+class WriteFileStmt(_Node):
+    node_kind = 45
+    __slots__ = ('content_expr', 'file_expr')
+    _fields = ('line', 'content_expr', 'file_expr')
+    __match_args__ = ('content_expr', 'file_expr')
+
+    def __init__(self, content_expr: Any, file_expr: Any, line: int = 0):
+        self.line = line
+        self.content_expr = content_expr
+        self.file_expr = file_expr
+
+
+class AppendFileStmt(_Node):
+    node_kind = 46
+    __slots__ = ('content_expr', 'file_expr')
+    _fields = ('line', 'content_expr', 'file_expr')
+    __match_args__ = ('content_expr', 'file_expr')
+
+    def __init__(self, content_expr: Any, file_expr: Any, line: int = 0):
+        self.line = line
+        self.content_expr = content_expr
+        self.file_expr = file_expr
+
+
+class ImportStmt(_Node):
+    node_kind = 47
+    __slots__ = ('file_expr', 'alias', 'specific_imports')
+    _fields = ('line', 'file_expr', 'alias', 'specific_imports')
+    __match_args__ = ('file_expr', 'alias', 'specific_imports')
+
+    def __init__(self, file_expr: Any, alias: Optional[str] = None, specific_imports: Optional[List[str]] = None, line: int = 0):
+        self.line = line
+        self.file_expr = file_expr
+        self.alias = alias
+        self.specific_imports = specific_imports
+
+
+class ThrowStmt(_Node):
+    node_kind = 48
+    __slots__ = ('msg_expr',)
+    _fields = ('line', 'msg_expr')
+    __match_args__ = ('msg_expr',)
+
+    def __init__(self, msg_expr: Any, line: int = 0):
+        self.line = line
+        self.msg_expr = msg_expr
+
+
+class JsonParseExpr(_Node):
+    node_kind = 49
+    __slots__ = ('text_expr',)
+    _fields = ('line', 'text_expr')
+    __match_args__ = ('text_expr',)
+
+    def __init__(self, text_expr: Any, line: int = 0):
+        self.line = line
+        self.text_expr = text_expr
+
+
+class JsonStringifyExpr(_Node):
+    node_kind = 50
+    __slots__ = ('dict_expr',)
+    _fields = ('line', 'dict_expr')
+    __match_args__ = ('dict_expr',)
+
+    def __init__(self, dict_expr: Any, line: int = 0):
+        self.line = line
+        self.dict_expr = dict_expr
+
+
+class ParamDef(_Record):
+    __slots__ = ('name', 'default_expr')
+    _fields = ('name', 'default_expr')
+    __match_args__ = ('name', 'default_expr')
+
+    def __init__(self, name: str, default_expr: Optional[Any] = None):
+        self.name = name
+        self.default_expr = default_expr
+
+
+class HttpGetExpr(_Node):
+    node_kind = 51
+    __slots__ = ('url_expr',)
+    _fields = ('line', 'url_expr')
+    __match_args__ = ('url_expr',)
+
+    def __init__(self, url_expr: Any, line: int = 0):
+        self.line = line
+        self.url_expr = url_expr
+
+
+class HttpPostExpr(_Node):
+    node_kind = 52
+    __slots__ = ('url_expr', 'payload_expr')
+    _fields = ('line', 'url_expr', 'payload_expr')
+    __match_args__ = ('url_expr', 'payload_expr')
+
+    def __init__(self, url_expr: Any, payload_expr: Any, line: int = 0):
+        self.line = line
+        self.url_expr = url_expr
+        self.payload_expr = payload_expr
+
+
+class ClassDef(_Node):
+    node_kind = 53
+    __slots__ = ('name', 'properties', 'parent')
+    _fields = ('line', 'name', 'properties', 'parent')
+    __match_args__ = ('name', 'properties', 'parent')
+
+    def __init__(self, name: str, properties: List[str], parent: Optional[str] = None, line: int = 0):
+        self.line = line
+        self.name = name
+        self.properties = properties
+        self.parent = parent
+
+
+class MethodDef(_Node):
+    node_kind = 54
+    __slots__ = ('class_name', 'name', 'params', 'body')
+    _fields = ('line', 'class_name', 'name', 'params', 'body')
+    __match_args__ = ('class_name', 'name', 'params', 'body')
+
+    def __init__(self, class_name: str, name: str, params: List[ParamDef], body: List[Any], line: int = 0):
+        self.line = line
+        self.class_name = class_name
+        self.name = name
+        self.params = params
+        self.body = body
+
+
+class NewInstanceExpr(_Node):
+    node_kind = 55
+    __slots__ = ('class_name', 'args')
+    _fields = ('line', 'class_name', 'args')
+    __match_args__ = ('class_name', 'args')
+
+    def __init__(self, class_name: str, args: List[tuple[str, Any]], line: int = 0):
+        self.line = line
+        self.class_name = class_name
+        self.args = args
+
+
+class PropertyAccessExpr(_Node):
+    node_kind = 56
+    __slots__ = ('obj_expr', 'prop_name')
+    _fields = ('line', 'obj_expr', 'prop_name')
+    __match_args__ = ('obj_expr', 'prop_name')
+
+    def __init__(self, obj_expr: Any, prop_name: str, line: int = 0):
+        self.line = line
+        self.obj_expr = obj_expr
+        self.prop_name = prop_name
+
+
+class SetPropertyStmt(_Node):
+    node_kind = 57
+    __slots__ = ('obj_expr', 'prop_name', 'value_expr')
+    _fields = ('line', 'obj_expr', 'prop_name', 'value_expr')
+    __match_args__ = ('obj_expr', 'prop_name', 'value_expr')
+
+    def __init__(self, obj_expr: Any, prop_name: str, value_expr: Any, line: int = 0):
+        self.line = line
+        self.obj_expr = obj_expr
+        self.prop_name = prop_name
+        self.value_expr = value_expr
+
+
+class MethodCallStmt(_Node):
+    node_kind = 58
+    __slots__ = ('obj_expr', 'method_name', 'args')
+    _fields = ('line', 'obj_expr', 'method_name', 'args')
+    __match_args__ = ('obj_expr', 'method_name', 'args')
+
+    def __init__(self, obj_expr: Any, method_name: str, args: List[Any], line: int = 0):
+        self.line = line
+        self.obj_expr = obj_expr
+        self.method_name = method_name
+        self.args = args
+
+
+class TimeOp(_Node):
+    node_kind = 59
+    __slots__ = ('op_type',)
+    _fields = ('line', 'op_type')
+    __match_args__ = ('op_type',)
+
+    def __init__(self, op_type: str, line: int = 0):
+        self.line = line
+        self.op_type = op_type
+
+
+class InterpolatedString(_Node):
+    node_kind = 60
+    __slots__ = ('parts',)
+    _fields = ('line', 'parts')
+    __match_args__ = ('parts',)
+
+    def __init__(self, parts: List[Any], line: int = 0):
+        self.line = line
+        self.parts = parts
+
+
+class CheckStmt(_Node):
+    node_kind = 61
+    __slots__ = ('expr', 'cases', 'otherwise')
+    _fields = ('line', 'expr', 'cases', 'otherwise')
+    __match_args__ = ('expr', 'cases', 'otherwise')
+
+    def __init__(self, expr: Any, cases: List[tuple], otherwise: List[Any], line: int = 0):
+        self.line = line
+        self.expr = expr
+        self.cases = cases
+        self.otherwise = otherwise
+
+
+class LambdaExpr(_Node):
+    node_kind = 62
+    __slots__ = ('params', 'body_expr')
+    _fields = ('line', 'params', 'body_expr')
+    __match_args__ = ('params', 'body_expr')
+
+    def __init__(self, params: List[ParamDef], body_expr: Any, line: int = 0):
+        self.line = line
+        self.params = params
+        self.body_expr = body_expr
+
+
+class BlockLambda(_Node):
+    node_kind = 63
+    __slots__ = ('params', 'body', 'name', 'is_async')
+    _fields = ('line', 'params', 'body', 'name', 'is_async')
+    __match_args__ = ('params', 'body', 'name', 'is_async')
+
+    def __init__(self, params: List[ParamDef], body: List[Any], name: str = '<inline>', is_async: bool = False, line: int = 0):
+        self.line = line
+        self.params = params
+        self.body = body
+        self.name = name
+        self.is_async = is_async
+
+
+class MapExpr(_Node):
+    node_kind = 64
+    __slots__ = ('func_expr', 'list_expr')
+    _fields = ('line', 'func_expr', 'list_expr')
+    __match_args__ = ('func_expr', 'list_expr')
+
+    def __init__(self, func_expr: Any, list_expr: Any, line: int = 0):
+        self.line = line
+        self.func_expr = func_expr
+        self.list_expr = list_expr
+
+
+class FilterExpr(_Node):
+    node_kind = 65
+    __slots__ = ('list_expr', 'var_name', 'condition')
+    _fields = ('line', 'list_expr', 'var_name', 'condition')
+    __match_args__ = ('list_expr', 'var_name', 'condition')
+
+    def __init__(self, list_expr: Any, var_name: str, condition: Any, line: int = 0):
+        self.line = line
+        self.list_expr = list_expr
+        self.var_name = var_name
+        self.condition = condition
+
+
+class EnumDef(_Node):
+    node_kind = 66
+    __slots__ = ('name', 'values')
+    _fields = ('line', 'name', 'values')
+    __match_args__ = ('name', 'values')
+
+    def __init__(self, name: str, values: List[str], line: int = 0):
+        self.line = line
+        self.name = name
+        self.values = values
+
+
+class AttemptStmt(_Node):
+    node_kind = 67
+    __slots__ = ('try_body', 'error_var', 'catch_body')
+    _fields = ('line', 'try_body', 'error_var', 'catch_body')
+    __match_args__ = ('try_body', 'error_var', 'catch_body')
+
+    def __init__(self, try_body: List[Any], error_var: str, catch_body: List[Any], line: int = 0):
+        self.line = line
+        self.try_body = try_body
+        self.error_var = error_var
+        self.catch_body = catch_body
+
+
+class WaitExpr(_Node):
+    node_kind = 68
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class RangeLoopStmt(_Node):
+    node_kind = 69
+    __slots__ = ('var_name', 'from_expr', 'to_expr', 'step_expr', 'body')
+    _fields = ('line', 'var_name', 'from_expr', 'to_expr', 'step_expr', 'body')
+    __match_args__ = ('var_name', 'from_expr', 'to_expr', 'step_expr', 'body')
+
+    def __init__(self, var_name: str, from_expr: Any, to_expr: Any, step_expr: Any, body: List[Any], line: int = 0):
+        self.line = line
+        self.var_name = var_name
+        self.from_expr = from_expr
+        self.to_expr = to_expr
+        self.step_expr = step_expr
+        self.body = body
+
+
+class AllWhereExpr(_Node):
+    node_kind = 70
+    __slots__ = ('var_name', 'source_expr', 'condition')
+    _fields = ('line', 'var_name', 'source_expr', 'condition')
+    __match_args__ = ('var_name', 'source_expr', 'condition')
+
+    def __init__(self, var_name: str, source_expr: Any, condition: Any, line: int = 0):
+        self.line = line
+        self.var_name = var_name
+        self.source_expr = source_expr
+        self.condition = condition
+
+
+class WhenStmt(_Node):
+    node_kind = 71
+    __slots__ = ('event', 'widget_expr', 'body')
+    _fields = ('line', 'event', 'widget_expr', 'body')
+    __match_args__ = ('event', 'widget_expr', 'body')
+
+    def __init__(self, event: str, widget_expr: Any, body: List[Any], line: int = 0):
+        self.line = line
+        self.event = event
+        self.widget_expr = widget_expr
+        self.body = body
+
+
+class CreateWindowStmt(_Node):
+    node_kind = 72
+    __slots__ = ('var_name', 'title_expr', 'width_expr', 'height_expr')
+    _fields = ('line', 'var_name', 'title_expr', 'width_expr', 'height_expr')
+    __match_args__ = ('var_name', 'title_expr', 'width_expr', 'height_expr')
+
+    def __init__(self, var_name: str, title_expr: Any, width_expr: Any, height_expr: Any, line: int = 0):
+        self.line = line
+        self.var_name = var_name
+        self.title_expr = title_expr
+        self.width_expr = width_expr
+        self.height_expr = height_expr
+
+
+class AddWidgetStmt(_Node):
+    node_kind = 73
+    __slots__ = ('widget_type', 'window_expr', 'label_expr', 'var_name', 'callback_body', 'row_expr', 'col_expr', 'colspan_expr')
+    _fields = ('line', 'widget_type', 'window_expr', 'label_expr', 'var_name', 'callback_body', 'row_expr', 'col_expr', 'colspan_expr')
+    __match_args__ = ('widget_type', 'window_expr', 'label_expr', 'var_name', 'callback_body', 'row_expr', 'col_expr', 'colspan_expr')
+
+    def __init__(self, widget_type: str, window_expr: Any, label_expr: Any, var_name: str, callback_body: Any, row_expr: Any, col_expr: Any, colspan_expr: Any, line: int = 0):
+        self.line = line
+        self.widget_type = widget_type
+        self.window_expr = window_expr
+        self.label_expr = label_expr
+        self.var_name = var_name
+        self.callback_body = callback_body
+        self.row_expr = row_expr
+        self.col_expr = col_expr
+        self.colspan_expr = colspan_expr
+
+
+class RunWindowStmt(_Node):
+    node_kind = 74
+    __slots__ = ('window_expr',)
+    _fields = ('line', 'window_expr')
+    __match_args__ = ('window_expr',)
+
+    def __init__(self, window_expr: Any, line: int = 0):
+        self.line = line
+        self.window_expr = window_expr
+
+
+class SetTextStmt(_Node):
+    node_kind = 75
+    __slots__ = ('widget_expr', 'value_expr')
+    _fields = ('line', 'widget_expr', 'value_expr')
+    __match_args__ = ('widget_expr', 'value_expr')
+
+    def __init__(self, widget_expr: Any, value_expr: Any, line: int = 0):
+        self.line = line
+        self.widget_expr = widget_expr
+        self.value_expr = value_expr
+
+
+class EnumAccess(_Node):
+    node_kind = 76
+    __slots__ = ('enum_name', 'value_name')
+    _fields = ('line', 'enum_name', 'value_name')
+    __match_args__ = ('enum_name', 'value_name')
+
+    def __init__(self, enum_name: str, value_name: str, line: int = 0):
+        self.line = line
+        self.enum_name = enum_name
+        self.value_name = value_name
+
+
+class CliArgsExpr(_Node):
+    node_kind = 77
+    __slots__ = ()
+    _fields = ('line',)
+    __match_args__ = ()
+
+    def __init__(self, line: int = 0):
+        self.line = line
+
+
+class EnvVarExpr(_Node):
+    node_kind = 78
+    __slots__ = ('name_expr',)
+    _fields = ('line', 'name_expr')
+    __match_args__ = ('name_expr',)
+
+    def __init__(self, name_expr: Any, line: int = 0):
+        self.line = line
+        self.name_expr = name_expr
+
+
+class TestBlock(_Node):
+    node_kind = 79
+    __slots__ = ('name', 'body')
+    _fields = ('line', 'name', 'body')
+    __match_args__ = ('name', 'body')
+
+    def __init__(self, name: str, body: List[Any], line: int = 0):
+        self.line = line
+        self.name = name
+        self.body = body
+
+
+class AssertStmt(_Node):
+    node_kind = 80
+    __slots__ = ('condition',)
+    _fields = ('line', 'condition')
+    __match_args__ = ('condition',)
+
+    def __init__(self, condition: Any, line: int = 0):
+        self.line = line
+        self.condition = condition
+
+
+class RunTestsStmt(_Node):
+    node_kind = 81
+    __slots__ = ()
+    _fields = ('line',)
+    __match_args__ = ()
+
+    def __init__(self, line: int = 0):
+        self.line = line
+
+
+class RegexMatchExpr(_Node):
+    node_kind = 82
+    __slots__ = ('pattern_expr', 'text_expr')
+    _fields = ('line', 'pattern_expr', 'text_expr')
+    __match_args__ = ('pattern_expr', 'text_expr')
+
+    def __init__(self, pattern_expr: Any, text_expr: Any, line: int = 0):
+        self.line = line
+        self.pattern_expr = pattern_expr
+        self.text_expr = text_expr
+
+
+class RegexTestExpr(_Node):
+    node_kind = 83
+    __slots__ = ('text_expr', 'pattern_expr')
+    _fields = ('line', 'text_expr', 'pattern_expr')
+    __match_args__ = ('text_expr', 'pattern_expr')
+
+    def __init__(self, text_expr: Any, pattern_expr: Any, line: int = 0):
+        self.line = line
+        self.text_expr = text_expr
+        self.pattern_expr = pattern_expr
+
+
+class StringIndexExpr(_Node):
+    node_kind = 84
+    __slots__ = ('str_expr', 'index_expr')
+    _fields = ('line', 'str_expr', 'index_expr')
+    __match_args__ = ('str_expr', 'index_expr')
+
+    def __init__(self, str_expr: Any, index_expr: Any, line: int = 0):
+        self.line = line
+        self.str_expr = str_expr
+        self.index_expr = index_expr
+
+
+class StringSliceExpr(_Node):
+    node_kind = 85
+    __slots__ = ('str_expr', 'start_expr', 'end_expr')
+    _fields = ('line', 'str_expr', 'start_expr', 'end_expr')
+    __match_args__ = ('str_expr', 'start_expr', 'end_expr')
+
+    def __init__(self, str_expr: Any, start_expr: Any, end_expr: Any, line: int = 0):
+        self.line = line
+        self.str_expr = str_expr
+        self.start_expr = start_expr
+        self.end_expr = end_expr
+
+
+class LetStmt(_Node):
+    node_kind = 86
+    __slots__ = ('name', 'expr')
+    _fields = ('line', 'name', 'expr')
+    __match_args__ = ('name', 'expr')
+
+    def __init__(self, name: str, expr: Any, line: int = 0):
+        self.line = line
+        self.name = name
+        self.expr = expr
+
+
+class DisplayStmt(_Node):
+    node_kind = 87
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class SayStmt(_Node):
+    node_kind = 88
+    __slots__ = ('parts',)
+    _fields = ('line', 'parts')
+    __match_args__ = ('parts',)
+
+    def __init__(self, parts: List[Any], line: int = 0):
+        self.line = line
+        self.parts = parts
+
+
+class AskStmt(_Node):
+    node_kind = 89
+    __slots__ = ('variable',)
+    _fields = ('line', 'variable')
+    __match_args__ = ('variable',)
+
+    def __init__(self, variable: str, line: int = 0):
+        self.line = line
+        self.variable = variable
+
+
+class IfStmt(_Node):
+    node_kind = 90
+    __slots__ = ('condition', 'then_body', 'else_body')
+    _fields = ('line', 'condition', 'then_body', 'else_body')
+    __match_args__ = ('condition', 'then_body', 'else_body')
+
+    def __init__(self, condition: Any, then_body: List[Any], else_body: List[Any] = None, line: int = 0):
+        self.line = line
+        self.condition = condition
+        self.then_body = then_body
+        self.else_body = [] if else_body is None else else_body
+
+
+class RepeatStmt(_Node):
+    node_kind = 91
+    __slots__ = ('count', 'body')
+    _fields = ('line', 'count', 'body')
+    __match_args__ = ('count', 'body')
+
+    def __init__(self, count: Any, body: List[Any], line: int = 0):
+        self.line = line
+        self.count = count
+        self.body = body
+
+
+class WhileStmt(_Node):
+    node_kind = 92
+    __slots__ = ('condition', 'body')
+    _fields = ('line', 'condition', 'body')
+    __match_args__ = ('condition', 'body')
+
+    def __init__(self, condition: Any, body: List[Any], line: int = 0):
+        self.line = line
+        self.condition = condition
+        self.body = body
+
+
+class ForEachStmt(_Node):
+    node_kind = 93
+    __slots__ = ('var', 'iterable', 'body')
+    _fields = ('line', 'var', 'iterable', 'body')
+    __match_args__ = ('var', 'iterable', 'body')
+
+    def __init__(self, var: str, iterable: Any, body: List[Any], line: int = 0):
+        self.line = line
+        self.var = var
+        self.iterable = iterable
+        self.body = body
+
+
+class FunctionDef(_Node):
+    node_kind = 94
+    __slots__ = ('name', 'params', 'body', 'is_async')
+    _fields = ('line', 'name', 'params', 'body', 'is_async')
+    __match_args__ = ('name', 'params', 'body', 'is_async')
+
+    def __init__(self, name: str, params: List[ParamDef], body: List[Any], is_async: bool = False, line: int = 0):
+        self.line = line
+        self.name = name
+        self.params = params
+        self.body = body
+        self.is_async = is_async
+
+
+class CallStmt(_Node):
+    node_kind = 95
+    __slots__ = ('name', 'args', 'obj_expr', 'chained_calls')
+    _fields = ('line', 'name', 'args', 'obj_expr', 'chained_calls')
+    __match_args__ = ('name', 'args', 'obj_expr', 'chained_calls')
+
+    def __init__(self, name: str, args: List[Any], obj_expr: Optional[Any] = None, chained_calls: Optional[List[tuple[str, List[Any], int]]] = None, line: int = 0):
+        self.line = line
+        self.name = name
+        self.args = args
+        self.obj_expr = obj_expr
+        self.chained_calls = chained_calls
+
+
+class LetResultStmt(_Node):
+    node_kind = 96
+    __slots__ = ('variable', 'func_name', 'args', 'obj_expr', 'chained_calls')
+    _fields = ('line', 'variable', 'func_name', 'args', 'obj_expr', 'chained_calls')
+    __match_args__ = ('variable', 'func_name', 'args', 'obj_expr', 'chained_calls')
+
+    def __init__(self, variable: str, func_name: str, args: List[Any], obj_expr: Optional[Any] = None, chained_calls: Optional[List[tuple[str, List[Any], int]]] = None, line: int = 0):
+        self.line = line
+        self.variable = variable
+        self.func_name = func_name
+        self.args = args
+        self.obj_expr = obj_expr
+        self.chained_calls = chained_calls
+
+
+class GiveBackStmt(_Node):
+    node_kind = 97
+    __slots__ = ('expr',)
+    _fields = ('line', 'expr')
+    __match_args__ = ('expr',)
+
+    def __init__(self, expr: Any, line: int = 0):
+        self.line = line
+        self.expr = expr
+
+
+class AddToListStmt(_Node):
+    node_kind = 98
+    __slots__ = ('value', 'list_name')
+    _fields = ('line', 'value', 'list_name')
+    __match_args__ = ('value', 'list_name')
+
+    def __init__(self, value: Any, list_name: str, line: int = 0):
+        self.line = line
+        self.value = value
+        self.list_name = list_name
+
+
+class RemoveFromListStmt(_Node):
+    node_kind = 99
+    __slots__ = ('index', 'list_name')
+    _fields = ('line', 'index', 'list_name')
+    __match_args__ = ('index', 'list_name')
+
+    def __init__(self, index: Any, list_name: str, line: int = 0):
+        self.line = line
+        self.index = index
+        self.list_name = list_name
+
+
+class StopStmt(_Node):
+    node_kind = 100
+    __slots__ = ()
+    _fields = ('line',)
+    __match_args__ = ()
+
+    def __init__(self, line: int = 0):
+        self.line = line
+
+
+class SkipStmt(_Node):
+    node_kind = 101
+    __slots__ = ()
+    _fields = ('line',)
+    __match_args__ = ()
+
+    def __init__(self, line: int = 0):
+        self.line = line
+
+
+# Every node class, indexed by its node_kind.
+NODE_TYPES: List[type] = [
+    NumberLiteral,
+    StringLiteral,
+    BoolLiteral,
+    NoneLiteral,
+    LiteralNode,
+    Identifier,
+    BinOp,
+    UnaryMinus,
+    CompoundCondition,
+    Condition,
+    ListLiteral,
+    ListAccess,
+    LengthOf,
+    UppercaseOf,
+    LowercaseOf,
+    ContainsExpr,
+    JoinWith,
+    TypeCheck,
+    ReplaceIn,
+    SplitBy,
+    TrimOf,
+    RepeatStr,
+    ListContainsExpr,
+    SortList,
+    IndexOf,
+    RoundOf,
+    AbsOf,
+    RandomBetween,
+    MinOf,
+    MaxOf,
+    SqrtOf,
+    FloorOf,
+    CeilingOf,
+    PowerOf,
+    AsNumber,
+    AsText,
+    TryCatch,
+    DictLiteral,
+    DictAccess,
+    DictHasKey,
+    DictKeys,
+    SetDictValueStmt,
+    RemoveDictValueStmt,
+    FileContents,
+    FileExists,
+    WriteFileStmt,
+    AppendFileStmt,
+    ImportStmt,
+    ThrowStmt,
+    JsonParseExpr,
+    JsonStringifyExpr,
+    HttpGetExpr,
+    HttpPostExpr,
+    ClassDef,
+    MethodDef,
+    NewInstanceExpr,
+    PropertyAccessExpr,
+    SetPropertyStmt,
+    MethodCallStmt,
+    TimeOp,
+    InterpolatedString,
+    CheckStmt,
+    LambdaExpr,
+    BlockLambda,
+    MapExpr,
+    FilterExpr,
+    EnumDef,
+    AttemptStmt,
+    WaitExpr,
+    RangeLoopStmt,
+    AllWhereExpr,
+    WhenStmt,
+    CreateWindowStmt,
+    AddWidgetStmt,
+    RunWindowStmt,
+    SetTextStmt,
+    EnumAccess,
+    CliArgsExpr,
+    EnvVarExpr,
+    TestBlock,
+    AssertStmt,
+    RunTestsStmt,
+    RegexMatchExpr,
+    RegexTestExpr,
+    StringIndexExpr,
+    StringSliceExpr,
+    LetStmt,
+    DisplayStmt,
+    SayStmt,
+    AskStmt,
+    IfStmt,
+    RepeatStmt,
+    WhileStmt,
+    ForEachStmt,
+    FunctionDef,
+    CallStmt,
+    LetResultStmt,
+    GiveBackStmt,
+    AddToListStmt,
+    RemoveFromListStmt,
+    StopStmt,
+    SkipStmt,
+]
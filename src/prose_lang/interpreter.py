@@ -19,8 +19,9 @@ import urllib.request
 import urllib.error
 import re
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from .parser import (
+    NODE_TYPES,
     NumberLiteral, StringLiteral, BoolLiteral, NoneLiteral, LiteralNode,
     Identifier, BinOp, UnaryMinus,
     Condition, CompoundCondition,
@@ -41,7 +42,7 @@ from .parser import (
     FileContents, FileExists, WriteFileStmt, AppendFileStmt, ImportStmt, ThrowStmt, TimeOp,
     # Phase 5
     JsonParseExpr, JsonStringifyExpr, HttpGetExpr, HttpPostExpr,
-    ClassDef, MethodDef, NewInstanceExpr, PropertyAccessExpr, SetPropertyStmt, MethodCallStmt,
+    ClassDef, MethodDef, NewInstanceExpr, PropertyAccessExpr, SetPropertyStmt,
     # Phase 6
     InterpolatedString, CheckStmt, LambdaExpr, MapExpr, FilterExpr,
     EnumDef, EnumAccess, CliArgsExpr, EnvVarExpr,
@@ -133,58 +134,25 @@ class Interpreter:
             self.execute_stmt(stmt, env)
 
     def execute_stmt(self, node: Any, env: Environment):
-        t = type(node)
-        if t is LetStmt:            self._exec_let(node, env)
-        elif t is LetResultStmt:    self._exec_let_result(node, env)
-        elif t is DisplayStmt:      self._exec_display(node, env)
-        elif t is SayStmt:          self._exec_say(node, env)
-        elif t is AskStmt:          self._exec_ask(node, env)
-        elif t is IfStmt:           self._exec_if(node, env)
-        elif t is RepeatStmt:       self._exec_repeat(node, env)
-        elif t is WhileStmt:        self._exec_while(node, env)
-        elif t is ForEachStmt:      self._exec_for_each(node, env)
-        elif t is FunctionDef:      self.functions[node.name] = node
-        elif t is CallStmt:         self._exec_call(node, env)
-        elif t is GiveBackStmt:
-            raise ReturnException(self.evaluate(node.expr, env))
-        elif t is AddToListStmt:    self._exec_add_to_list(node, env)
-        elif t is RemoveFromListStmt: self._exec_remove_from_list(node, env)
-        elif t is StopStmt:         raise StopException()
-        elif t is SkipStmt:         raise SkipException()
-        elif t is SortList:         self._exec_sort_list(node, env)
-        elif t is TryCatch:         self._exec_try_catch(node, env)
-        elif t is SetDictValueStmt: self._exec_set_dict_value(node, env)
-        elif t is RemoveDictValueStmt: self._exec_remove_dict_value(node, env)
-        elif t is WriteFileStmt:    self._exec_write_file(node, env)
-        elif t is AppendFileStmt:   self._exec_append_file(node, env)
-        elif t is ImportStmt:       self._exec_import(node, env)
-        elif t is ThrowStmt:        self._exec_throw(node, env)
-        # Phase 5
-        elif t is ClassDef:         self._exec_class_def(node, env)
-        elif t is MethodDef:        self._exec_method_def(node, env)
-        elif t is SetPropertyStmt:  self._exec_set_property(node, env)
-        elif t is MethodCallStmt:   self._exec_method_call(node, env)
-        # Phase 6
-        elif t is CheckStmt:        self._exec_check(node, env)
-        elif t is EnumDef:          self._exec_enum_def(node, env)
-        elif t is TestBlock:        self._exec_test_block(node, env)
-        elif t is AssertStmt:       self._exec_assert(node, env)
-        elif t is RunTestsStmt:     self._exec_run_tests(node, env)
-        # Phase 8
-        elif t is AttemptStmt:      self._exec_attempt(node, env)
-        # Phase A — GUI
-        elif t is CreateWindowStmt: self._exec_create_window(node, env)
-        elif t is AddWidgetStmt:    self._exec_add_widget(node, env)
-        elif t is RunWindowStmt:    self._exec_run_window(node, env)
-        elif t is SetTextStmt:      self._exec_set_text(node, env)
-        # Phase B — Beginner features
-        elif t is RangeLoopStmt:    self._exec_range_loop(node, env)
-        elif t is WhenStmt:         self._exec_when(node, env)
-        else:
+        handler = _STMT_HANDLERS[node.node_kind]
+        if handler is None:
             raise RuntimeError_(f"I do not know how to execute: {type(node).__name__}.")
+        handler(self, node, env)
 
     # ── Statements ────────────────────────────────────────────────────────────
 
+    def _exec_function_def(self, node: FunctionDef, env: Environment):
+        self.functions[node.name] = node
+
+    def _exec_give_back(self, node: GiveBackStmt, env: Environment):
+        raise ReturnException(self.evaluate(node.expr, env))
+
+    def _exec_stop(self, node: StopStmt, env: Environment):
+        raise StopException()
+
+    def _exec_skip(self, node: SkipStmt, env: Environment):
+        raise SkipException()
+
     def _exec_let(self, node: LetStmt, env: Environment):
         env.assign(node.name, self.evaluate(node.expr, env))
 
@@ -454,7 +422,6 @@ class Interpreter:
             module_env = Environment()
 
             def _plain_instance(class_name, tk_widget, extra_props=None):
-                from parser import ClassDef
                 dummy_class = ClassDef(name=class_name, properties=[], parent=None)
                 props = {"_tk": tk_widget}
                 if extra_props:
@@ -563,8 +530,8 @@ class Interpreter:
         except Exception as e:
             raise RuntimeError_(f"Line {node.line}: Could not read file '{filepath}' for import. ({e})")
         
-        from lexer import Lexer
-        from parser import Parser
+        from .lexer import Lexer
+        from .parser import Parser
         try:
             tokens = Lexer(source).tokenize()
             statements = Parser(tokens).parse()
@@ -623,7 +590,6 @@ class Interpreter:
 
     def _exec_create_window(self, node: CreateWindowStmt, env: Environment):
         tk = self._gui_get_tk()
-        from parser import ClassDef
         title  = str(self.evaluate(node.title_expr, env))
         width  = int(self.evaluate(node.width_expr, env))
         height = int(self.evaluate(node.height_expr, env))
@@ -645,7 +611,6 @@ class Interpreter:
 
     def _exec_add_widget(self, node: AddWidgetStmt, env: Environment):
         tk = self._gui_get_tk()
-        from parser import ClassDef
         window_inst = self.evaluate(node.window_expr, env)
         if not isinstance(window_inst, Instance) or "_tk" not in window_inst.properties:
             raise RuntimeError_(f"Line {node.line}: Expected a Window object.")
@@ -1663,10 +1628,15 @@ class Interpreter:
 
     def evaluate_condition(self, node: Any, env: Environment) -> bool:
         if type(node) is CompoundCondition:
-            left = self.evaluate_condition(node.left, env)
             if node.connective == "and":
-                return left and self.evaluate_condition(node.right, env)
-            return left or self.evaluate_condition(node.right, env)
+                for operand in node.operands:
+                    if not self.evaluate_condition(operand, env):
+                        return False
+                return True
+            for operand in node.operands:
+                if self.evaluate_condition(operand, env):
+                    return True
+            return False
 
         if type(node) is FileExists:
             filepath = str(self.evaluate(node.file_expr, env))
@@ -1722,3 +1692,55 @@ class Interpreter:
             return "{" + ", ".join(pairs) + "}"
         if isinstance(value, float) and value == int(value): return str(int(value))
         return str(value)
+
+
+# Statement handlers indexed by node_kind; None means "not a statement".
+_STMT_HANDLERS: List[Optional[Callable[[Interpreter, Any, Environment], None]]] = [None] * len(NODE_TYPES)
+for _type, _handler in (
+    (LetStmt,             Interpreter._exec_let),
+    (LetResultStmt,       Interpreter._exec_let_result),
+    (DisplayStmt,         Interpreter._exec_display),
+    (SayStmt,             Interpreter._exec_say),
+    (AskStmt,             Interpreter._exec_ask),
+    (IfStmt,              Interpreter._exec_if),
+    (RepeatStmt,          Interpreter._exec_repeat),
+    (WhileStmt,           Interpreter._exec_while),
+    (ForEachStmt,         Interpreter._exec_for_each),
+    (FunctionDef,         Interpreter._exec_function_def),
+    (CallStmt,            Interpreter._exec_call),
+    (GiveBackStmt,        Interpreter._exec_give_back),
+    (AddToListStmt,       Interpreter._exec_add_to_list),
+    (RemoveFromListStmt,  Interpreter._exec_remove_from_list),
+    (StopStmt,            Interpreter._exec_stop),
+    (SkipStmt,            Interpreter._exec_skip),
+    (SortList,            Interpreter._exec_sort_list),
+    (TryCatch,            Interpreter._exec_try_catch),
+    (SetDictValueStmt,    Interpreter._exec_set_dict_value),
+    (RemoveDictValueStmt, Interpreter._exec_remove_dict_value),
+    (WriteFileStmt,       Interpreter._exec_write_file),
+    (AppendFileStmt,      Interpreter._exec_append_file),
+    (ImportStmt,          Interpreter._exec_import),
+    (ThrowStmt,           Interpreter._exec_throw),
+    # Phase 5
+    (ClassDef,            Interpreter._exec_class_def),
+    (MethodDef,           Interpreter._exec_method_def),
+    (SetPropertyStmt,     Interpreter._exec_set_property),
+    # Phase 6
+    (CheckStmt,           Interpreter._exec_check),
+    (EnumDef,             Interpreter._exec_enum_def),
+    (TestBlock,           Interpreter._exec_test_block),
+    (AssertStmt,          Interpreter._exec_assert),
+    (RunTestsStmt,        Interpreter._exec_run_tests),
+    # Phase 8
+    (AttemptStmt,         Interpreter._exec_attempt),
+    # Phase A — GUI
+    (CreateWindowStmt,    Interpreter._exec_create_window),
+    (AddWidgetStmt,       Interpreter._exec_add_widget),
+    (RunWindowStmt,       Interpreter._exec_run_window),
+    (SetTextStmt,         Interpreter._exec_set_text),
+    # Phase B — Beginner features
+    (RangeLoopStmt,       Interpreter._exec_range_loop),
+    (WhenStmt,            Interpreter._exec_when),
+):
+    _STMT_HANDLERS[_type.node_kind] = _handler
+del _type, _handler
@@ -0,0 +1,7 @@
+# Cython declarations for lexer.py, read only by the optional compiled build
+# (see setup.py). Plain Python ignores this file.
+
+cdef class Lexer:
+    cdef public str source
+    cdef public Py_ssize_t pos
+    cdef public Py_ssize_t line
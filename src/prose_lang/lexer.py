@@ -8,7 +8,7 @@ Inline comments: --- or // skip to end of line.
 String interpolation: {expr} inside "..." strings.
 """
 
-from dataclasses import dataclass
+from sys import intern
 from typing import List
 
 
@@ -39,15 +39,28 @@ LT     = "LT"      # <
 GT     = "GT"      # >
 
 
-@dataclass
 class Token:
-    type: str
-    value: str
-    line: int
+    # A plain slotted class rather than a dataclass or NamedTuple: one is
+    # built per token, and a hand-written __init__ is the cheapest of the
+    # three to construct while attribute reads cost the same.
+    __slots__ = ("type", "value", "line", "value_lower")
+
+    def __init__(self, type: str, value: str, line: int):
+        self.type = type
+        self.value = value
+        self.line = line
+        # Interned lowercase value of a WORD token ("" for every other type),
+        # so the parser can match keywords without calling .lower() each time.
+        self.value_lower = intern(value.lower()) if type == WORD else ""
 
     def __repr__(self):
         return f"Token({self.type}, {self.value!r}, line={self.line})"
 
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return (self.type, self.value, self.line) == (other.type, other.value, other.line)
+        return NotImplemented
+
 
 # ─── Lexer ─────────────────────────────────────────────────────────────────────
 
@@ -73,6 +86,10 @@ def strip_comments(source: str) -> str:
 
 class Lexer:
     def __init__(self, source: str):
+        self.reset(source)
+
+    def reset(self, source: str) -> None:
+        """Start over on new source text, so one Lexer can be reused."""
         self.source = strip_comments(source)
         self.pos = 0
         self.line = 1
@@ -117,7 +134,9 @@ class Lexer:
         while self.pos < len(self.source) and (self.source[self.pos].isalnum() or self.source[self.pos] == "_"):
             buf.append(self.source[self.pos])
             self.pos += 1
-        return Token(WORD, "".join(buf), start_line)
+        # Interned: the same few names recur all through a program, and they
+        # end up as Identifier names and Environment keys.
+        return Token(WORD, intern("".join(buf)), start_line)
 
     def tokenize(self) -> List[Token]:
         tokens: List[Token] = []
@@ -0,0 +1,8 @@
+# Cython declarations for parser.py, read only by the optional compiled build
+# (see setup.py). Plain Python ignores this file.
+
+cdef class Parser:
+    cdef public list tokens
+    cdef public Py_ssize_t pos
+    cdef list _types
+    cdef list _words
@@ -17,11 +17,12 @@ New in Phase 2:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import math
+from sys import intern as _intern
 from typing import List, Optional, Any
 
 from .lexer import (
-    Token, WORD, NUMBER, COMMA, PERIOD, COLON, STRING_QUOTED, INTERP_STRING, EOF,
+    Lexer, Token, WORD, NUMBER, COMMA, PERIOD, COLON, STRING_QUOTED, INTERP_STRING, EOF,
     PLUS, MINUS, STAR, SLASH, PERCENT, LBRACE, RBRACE,
     EQ, NEQ, LT, GT, LTE, GTE,
 )
@@ -29,673 +30,184 @@ from .lexer import (
 
 # ─── AST Nodes ─────────────────────────────────────────────────────────────────
 
-@dataclass
-class NumberLiteral:
-    value: float
-    line: int = 0
-
-@dataclass
-class StringLiteral:
-    value: str
-    line: int = 0
-
-@dataclass
-class BoolLiteral:
-    value: bool
-    line: int = 0
-
-@dataclass
-class NoneLiteral:
-    line: int = 0
-
-@dataclass
-class LiteralNode:
-    value: Any
-    line: int = 0
-
-@dataclass
-class Identifier:
-    name: str
-    line: int = 0
-
-@dataclass
-class BinOp:
-    left: Any
-    op: str    # plus, minus, times, divided_by, modulo
-    right: Any
-    line: int = 0
-
-@dataclass
-class UnaryMinus:
-    operand: Any
-    line: int = 0
-
-# Compound condition: left (and|or) right
-@dataclass
-class CompoundCondition:
-    left: Any        # Condition or CompoundCondition
-    connective: str  # "and" | "or"
-    right: Any
-    line: int = 0
-
-@dataclass
-class Condition:
-    left: Any
-    op: str   # greater_than, less_than, equals, not_equals, greater_equal, less_equal,
-              # is_number, is_text, is_list, is_boolean
-    right: Any  # None for type-check ops
-    line: int = 0
-
-@dataclass
-class ListLiteral:
-    elements: List[Any]
-    line: int = 0
-
-@dataclass
-class ListAccess:
-    list_expr: Any
-    index_expr: Any   # 1-based
-    line: int = 0
-
-@dataclass
-class LengthOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class UppercaseOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class LowercaseOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class ContainsExpr:
-    """X contains Y → bool"""
-    haystack: Any
-    needle: Any
-    line: int = 0
-
-@dataclass
-class JoinWith:
-    list_expr: Any
-    separator: Any
-    line: int = 0
-
-@dataclass
-class TypeCheck:
-    expr: Any
-    expected: str
-    line: int = 0
-
-# ── Phase 3 string nodes ────────────────────────────────────────────────────────
-
-@dataclass
-class ReplaceIn:
-    """replace Y in X with Z"""
-    source: Any   # the string to operate on
-    find: Any     # what to find
-    replacement: Any
-    line: int = 0
-
-@dataclass
-class SplitBy:
-    """split X by Y → list"""
-    source: Any
-    delimiter: Any
-    line: int = 0
-
-@dataclass
-class TrimOf:
-    """trim X → removes leading/trailing whitespace"""
-    expr: Any
-    line: int = 0
-
-@dataclass
-class RepeatStr:
-    """repeat X N times → string"""
-    expr: Any
-    count: Any
-    line: int = 0
-
-@dataclass
-class ListContainsExpr:
-    """myList contains X → bool"""
-    list_expr: Any
-    item: Any
-    line: int = 0
-
-@dataclass
-class SortList:
-    """sort myList (in place)"""
-    list_name: str
-    line: int = 0
-
-@dataclass
-class IndexOf:
-    """index of X in myList → number (1-based, 0 if not found)"""
-    item: Any
-    list_expr: Any
-    line: int = 0
-
-# ── Phase 3 math nodes ──────────────────────────────────────────────────────────
-
-@dataclass
-class RoundOf:
-    expr: Any
-    places: Any   # None = round to integer
-    line: int = 0
-
-@dataclass
-class AbsOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class RandomBetween:
-    low: Any
-    high: Any
-    line: int = 0
-
-@dataclass
-class MinOf:
-    left: Any
-    right: Any
-    line: int = 0
-
-@dataclass
-class MaxOf:
-    left: Any
-    right: Any
-    line: int = 0
-
-@dataclass
-class SqrtOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class FloorOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class CeilingOf:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class PowerOf:
-    base: Any
-    exp: Any
-    line: int = 0
-
-# ── Phase 3 conversion nodes ────────────────────────────────────────────────────
-
-@dataclass
-class AsNumber:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class AsText:
-    expr: Any
-    line: int = 0
-
-# ── Phase 3 error handling ──────────────────────────────────────────────────────
-
-@dataclass
-class TryCatch:
-    try_body: List[Any]
-    error_var: str          # variable name that gets the error message
-    catch_body: List[Any]
-    line: int = 0
-
-# ── Phase 4 Dictionary nodes ───────────────────────────────────────────────────
-
-@dataclass
-class DictLiteral:
-    pairs: List[tuple[Any, Any]]
-    line: int = 0
-
-@dataclass
-class DictAccess:
-    dict_expr: Any
-    key_expr: Any
-    line: int = 0
-
-@dataclass
-class DictHasKey:
-    dict_expr: Any
-    key_expr: Any
-    line: int = 0
-
-@dataclass
-class DictKeys:
-    dict_expr: Any
-    line: int = 0
-
-@dataclass
-class SetDictValueStmt:
-    dict_expr: Any
-    key_expr: Any
-    value_expr: Any
-    line: int = 0
-
-@dataclass
-class RemoveDictValueStmt:
-    dict_expr: Any
-    key_expr: Any
-    line: int = 0
-
-# ── Phase 4 File I/O & Module nodes ───────────────────────────────────────────
-
-@dataclass
-class FileContents:
-    file_expr: Any
-    line: int = 0
-
-@dataclass
-class FileExists:
-    file_expr: Any
-    line: int = 0
-
-@dataclass
-class WriteFileStmt:
-    content_expr: Any
-    file_expr: Any
-    line: int = 0
-
-@dataclass
-class AppendFileStmt:
-    content_expr: Any
-    file_expr: Any
-    line: int = 0
-
-@dataclass
-class ImportStmt:
-    file_expr: Any
-    alias: Optional[str] = None
-    specific_imports: Optional[List[str]] = None
-    line: int = 0
-
-@dataclass
-class ThrowStmt:
-    msg_expr: Any
-    line: int = 0
-
-# ── Phase 5 ────────────────────────────────────────────────────────────────
-@dataclass
-class JsonParseExpr:
-    text_expr: Any
-    line: int = 0
-
-@dataclass
-class JsonStringifyExpr:
-    dict_expr: Any
-    line: int = 0
-
-@dataclass
-class ParamDef:
-    name: str
-    default_expr: Optional[Any] = None
-
-@dataclass
-class HttpGetExpr:
-    url_expr: Any
-    line: int = 0
-
-@dataclass
-class HttpPostExpr:
-    url_expr: Any
-    payload_expr: Any
-    line: int = 0
-
-@dataclass
-class ClassDef:
-    name: str
-    properties: List[str]
-    parent: Optional[str] = None
-    line: int = 0
-
-@dataclass
-class MethodDef:
-    class_name: str
-    name: str
-    params: List[ParamDef]
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class NewInstanceExpr:
-    class_name: str
-    args: List[tuple[str, Any]]  # (prop_name, expr)
-    line: int = 0
-
-@dataclass
-class PropertyAccessExpr:
-    obj_expr: Any
-    prop_name: str
-    line: int = 0
-
-@dataclass
-class SetPropertyStmt:
-    obj_expr: Any
-    prop_name: str
-    value_expr: Any
-    line: int = 0
-
-@dataclass
-class MethodCallStmt:
-    obj_expr: Any
-    method_name: str
-    args: List[Any]
-    line: int = 0
-    line: int = 0
-
-@dataclass
-class TimeOp:
-    op_type: str  # "datetime", "year", "timestamp"
-    line: int = 0
-
-# ── Phase 6 ────────────────────────────────────────────────────────────────────────
-@dataclass
-class InterpolatedString:
-    parts: List[Any]  # list of StringLiteral and expression nodes
-    line: int = 0
-
-@dataclass
-class CheckStmt:
-    expr: Any
-    cases: List[tuple]  # [(value_expr, body_stmts), ...]
-    otherwise: List[Any]
-    line: int = 0
-
-@dataclass
-class LambdaExpr:
-    params: List[ParamDef]
-    body_expr: Any
-    line: int = 0
-
-@dataclass
-class BlockLambda:
-    """Multi-line inline function: a function that takes X and does the following...End function."""
-    params: List[ParamDef]
-    body: List[Any]
-    line: int = 0
-
-    # Fields to match FunctionDef interface so _call_function can work with it
-    name: str = "<inline>"
-    is_async: bool = False
-
-@dataclass
-class MapExpr:
-    func_expr: Any
-    list_expr: Any
-    line: int = 0
-
-@dataclass
-class FilterExpr:
-    list_expr: Any
-    var_name: str
-    condition: Any
-    line: int = 0
-
-@dataclass
-class EnumDef:
-    name: str
-    values: List[str]
-    line: int = 0
-
-# ── Phase 8 ───────────────────────────────────────────────────────────────────
-
-@dataclass
-class AttemptStmt:
-    try_body: List[Any]
-    error_var: str
-    catch_body: List[Any]
-    line: int = 0
-
-@dataclass
-class WaitExpr:
-    expr: Any
-    line: int = 0
-
-# ── Phase B — Beginner Power Features ────────────────────────────────────
-
-@dataclass
-class RangeLoopStmt:
-    var_name: str        # loop variable
-    from_expr: Any       # start value
-    to_expr: Any         # end value (inclusive)
-    step_expr: Any       # step (None = 1)
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class AllWhereExpr:
-    var_name: str        # iteration variable
-    source_expr: Any     # the list to filter
-    condition: Any       # filter condition (uses var_name)
-    line: int = 0
-
-@dataclass
-class WhenStmt:
-    event: str           # "enter", "closes", "click"
-    widget_expr: Any     # widget to bind (None for window events)
-    body: List[Any]
-    line: int = 0
-
-# ── Phase A — High-Level GUI ──────────────────────────────────────────────────
-
-@dataclass
-class CreateWindowStmt:
-    var_name: str        # variable to bind the window to
-    title_expr: Any
-    width_expr: Any
-    height_expr: Any
-    line: int = 0
-
-@dataclass
-class AddWidgetStmt:
-    widget_type: str     # "button", "label", "input"
-    window_expr: Any
-    label_expr: Any      # text/label (None for input)
-    var_name: str        # binding name (optional for button/label, required for input)
-    callback_body: Any   # BlockLambda / FunctionDef ref for buttons (None for others)
-    row_expr: Any        # grid row (optional)
-    col_expr: Any        # grid col (optional)
-    colspan_expr: Any    # colspan (optional)
-    line: int = 0
-
-@dataclass
-class RunWindowStmt:
-    window_expr: Any
-    line: int = 0
-
-@dataclass
-class SetTextStmt:
-    widget_expr: Any
-    value_expr: Any
-    line: int = 0
-
-@dataclass
-class EnumAccess:
-    enum_name: str
-    value_name: str
-    line: int = 0
-
-@dataclass
-class CliArgsExpr:
-    line: int = 0
-
-@dataclass
-class EnvVarExpr:
-    name_expr: Any
-    line: int = 0
-
-@dataclass
-class TestBlock:
-    name: str
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class AssertStmt:
-    condition: Any
-    line: int = 0
-
-@dataclass
-class RunTestsStmt:
-    line: int = 0
-
-@dataclass
-class RegexMatchExpr:
-    pattern_expr: Any
-    text_expr: Any
-    line: int = 0
-
-@dataclass
-class RegexTestExpr:
-    text_expr: Any
-    pattern_expr: Any
-    line: int = 0
-
-@dataclass
-class StringIndexExpr:
-    str_expr: Any
-    index_expr: Any
-    line: int = 0
-
-@dataclass
-class StringSliceExpr:
-    str_expr: Any
-    start_expr: Any
-    end_expr: Any
-    line: int = 0
-
-# Statements
-
-@dataclass
-class LetStmt:
-    name: str
-    expr: Any
-    line: int = 0
-
-@dataclass
-class DisplayStmt:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class SayStmt:
-    parts: List[Any]
-    line: int = 0
-
-@dataclass
-class AskStmt:
-    variable: str
-    line: int = 0
-
-@dataclass
-class IfStmt:
-    condition: Any      # Condition or CompoundCondition
-    then_body: List[Any]
-    else_body: List[Any] = field(default_factory=list)
-    line: int = 0
-
-@dataclass
-class RepeatStmt:
-    count: Any          # expression (not just int)
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class WhileStmt:
-    condition: Any
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class ForEachStmt:
-    var: str
-    iterable: Any
-    body: List[Any]
-    line: int = 0
-
-@dataclass
-class FunctionDef:
-    name: str
-    params: List[ParamDef]
-    body: List[Any]
-    is_async: bool = False
-    line: int = 0
-
-@dataclass
-class CallStmt:
-    name: str
-    args: List[Any]
-    line: int = 0
-    obj_expr: Optional[Any] = None
-    chained_calls: Optional[List[tuple[str, List[Any], int]]] = None
-
-@dataclass
-class LetResultStmt:
-    variable: str
-    func_name: str
-    args: List[Any]
-    line: int = 0
-    obj_expr: Optional[Any] = None
-    chained_calls: Optional[List[tuple[str, List[Any], int]]] = None
-
-@dataclass
-class GiveBackStmt:
-    expr: Any
-    line: int = 0
-
-@dataclass
-class AddToListStmt:
-    value: Any
-    list_name: str
-    line: int = 0
-
-@dataclass
-class RemoveFromListStmt:
-    index: Any
-    list_name: str
-    line: int = 0
-
-@dataclass
-class StopStmt:
-    line: int = 0
-
-@dataclass
-class SkipStmt:
-    line: int = 0
+# The node classes are generated from tools/ast_spec.py; edit the spec and
+# rerun tools/gen_ast_nodes.py rather than touching _ast_nodes.py.
+from ._ast_nodes import *  # noqa: F401,F403
 
 
 # ─── Parser ────────────────────────────────────────────────────────────────────
 
 class ParseError(Exception):
-    pass
+    """A syntax error; str() reads "Line N: message"."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(line, message)
+        self.line = line
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Line {self.line}: {self.message}"
+
+
+# Shared literal nodes. Nodes are never mutated after parsing and nothing
+# reports an error from a literal's own line, so one instance stands in for
+# every occurrence of these values (their line is left at 0).
+_TRUE = BoolLiteral(True)
+_FALSE = BoolLiteral(False)
+_NONE = NoneLiteral()
+_SMALL_INTS = {str(i): NumberLiteral(float(i)) for i in range(257)}
+
+# Expressions that are already a complete condition on their own.
+_BOOL_EXPR_TYPES = (ContainsExpr, BoolLiteral)
+
+# Word sets the parser tests the current token against (see Parser.word_in).
+_PARAM_LIST_END = frozenset({"does", "following", "with", "gives"})   # after "and"
+_NOT_PARAM_NAME = frozenset({"and", "does", "following", "that", "with"})
+_TYPE_WORDS     = frozenset({"number", "text", "list", "boolean"})
+_NUMBER_WORDS   = frozenset({"number", "numbers"})
+_CHECK_CASE_END = frozenset({"when", "otherwise", "end"})
+_SAY_EXPR_WORDS = frozenset({"uppercase", "lowercase", "item", "an", "length"})  # always an expr in Say
+
+# Words after "character"/"item" that mean no index follows, so the word is
+# a plain name ("if item is 3").
+_INDEX_STOP = frozenset({
+    "is", "equals", "has", "and", "or", "plus", "minus", "times", "divided", "modulo",
+})
+
+# Comparison operators spelt as symbols (see parse_condition).
+_COMPARE_SYMBOLS = {
+    GT: "greater_than", GTE: "greater_equal", LT: "less_than",
+    LTE: "less_equal", EQ: "equals", NEQ: "not_equals",
+}
+
+# Words that end a statement block (see Parser.parse_block).
+_BLOCK_END       = frozenset({"end"})
+_BLOCK_IF_END    = frozenset({"otherwise", "end"})
+_BLOCK_TRY_END   = frozenset({"rescue"})
+_BLOCK_TRY_ALT_END = frozenset({"handle"})
+
+# Arithmetic operators of parse_expr as (op, precedence), by token type and
+# by word. Higher precedence binds tighter.
+_BINARY_OPS = {
+    PLUS: ("plus", 1), MINUS: ("minus", 1),
+    STAR: ("times", 2), SLASH: ("divided_by", 2), PERCENT: ("modulo", 2),
+}
+_BINARY_WORDS = {
+    "plus": ("plus", 1), "minus": ("minus", 1),
+    "times": ("times", 2), "divided": ("divided_by", 2), "modulo": ("modulo", 2),
+}
+
+# Parsed {expr} bodies of interpolated strings, keyed by their text. The
+# same few expressions ("{name}", "{total}") recur throughout a program, and
+# each is parsed on its own at line 1, so the node can simply be reused.
+_INTERP_CACHE: dict = {}
+_INTERP_CACHE_SIZE = 1024
+
+# Idle Lexer/Parser pairs for those {expr} sub-parses (see _parse_fragment).
+# A pair is popped while in use, so a nested interpolation simply takes
+# another one.
+_FRAGMENT_POOL: list = []
+_FRAGMENT_POOL_SIZE = 8
+
+# Lowercase forms of the capitalised spellings passed to expect_words.
+_LOWERED = {w: w.lower() for w in ("End", "Rescue", "Handle")}
+
+# How far past the end of the token list the parser may look without
+# bounds-checking (see Parser._types / Parser._words). This is the whole
+# lookahead window: no probe reads more than _LOOKAHEAD tokens beyond
+# the current one, so peeks index the padded lists directly.
+_LOOKAHEAD = 4
+
+
+# Words that end a run of plain words collected by parse_factor into one
+# identifier or string ("the big red dog" ... "is").
+_STOP_WORDS = frozenset({
+    "plus", "minus", "times", "divided", "modulo", "is", "equals",
+    "then", "do", "following", "end", "otherwise",
+    "and", "or", "with", "that", "does", "takes", "back",
+    "greater", "less", "equal", "not", "than", "to",
+    "result", "of", "calling", "repeat", "while", "if",
+    "give", "define", "call", "ask", "say", "display", "let",
+    "be", "function", "called", "user", "for",
+    "add", "remove", "each", "in", "from", "item", "stop", "skip",
+    "containing", "length", "uppercase", "lowercase", "a", "an",
+    "error", "sort", "split", "join", "replace", "trim", "round",
+    "absolute", "value", "square", "root", "floor", "ceiling",
+    "random", "number", "between", "minimum", "maximum", "power",
+    "index", "by", "places", "place", "contains", "as",
+    "dictionary", "keys", "set", "has", "exists", "json", "parsed",
+    "fetching", "posting", "payload", "url", "class", "method",
+    "properties", "new", "on", "parameters",
+    # Phase 6
+    "over", "where", "extends", "enum", "check", "when",
+    "test", "assert", "run", "tests", "command", "arguments",
+    "environment", "variable", "mapping", "filtering", "matching",
+    "pattern", "gives", "values",
+})
+
+
+def _scan_words(types: List[str], pos: int) -> int:
+    """Return the index of the first token from pos on that is not a WORD or NUMBER."""
+    t = types[pos]
+    while t == WORD or t == NUMBER:
+        pos += 1
+        t = types[pos]
+    return pos
+
+
+# Constant folding. A pure numeric or text operation whose operands are
+# already literals is computed here, so the interpreter sees one literal
+# instead of re-evaluating the call every time the line runs. Only
+# operations where the interpreter and the transpiled Python agree on the
+# result are folded: square root, power and round are left alone because
+# the transpiled code yields floats (4.0) where the interpreter yields ints.
+
+def _fold_unary(cls: type, fn: Any, expr: Any, line: int) -> Any:
+    """cls(expr), or the number fn gives when expr is a finite number literal."""
+    if type(expr) is NumberLiteral and math.isfinite(expr.value):
+        return NumberLiteral(float(fn(expr.value)), line)
+    return cls(expr, line)
+
+
+def _fold_binary(cls: type, fn: Any, a: Any, b: Any, line: int) -> Any:
+    """cls(a, b), or the number fn gives when both are finite number literals."""
+    if (type(a) is NumberLiteral and type(b) is NumberLiteral
+            and math.isfinite(a.value) and math.isfinite(b.value)):
+        return NumberLiteral(float(fn(a.value, b.value)), line)
+    return cls(a, b, line)
+
+
+def _fold_text(cls: type, fn: Any, expr: Any, line: int) -> Any:
+    """cls(expr), or the string fn gives when expr is a string literal."""
+    if type(expr) is StringLiteral:
+        return StringLiteral(fn(expr.value), line)
+    return cls(expr, line)
 
 
 class Parser:
     def __init__(self, tokens: List[Token]):
+        self.reset(tokens)
+
+    def reset(self, tokens: List[Token]) -> None:
+        """Start over on a new token list, so one Parser can be reused."""
         self.tokens = tokens
         self.pos = 0
+        # Parallel views of the token stream for lookahead without touching
+        # Token objects: the type of each token, and the lowercased value of
+        # WORD tokens ("" for anything else). Both are padded past the final
+        # EOF so that peeking a few tokens ahead never needs a bounds check.
+        pad = [EOF] * _LOOKAHEAD
+        self._types = [t.type for t in tokens] + pad
+        self._words = [t.value_lower for t in tokens] + [""] * _LOOKAHEAD
 
     # ── Utilities ──────────────────────────────────────────────────────────────
 
     def current(self) -> Token:
         return self.tokens[self.pos]
 
-    def peek_ahead(self, offset: int = 1) -> Token:
-        idx = self.pos + offset
-        return self.tokens[idx] if idx < len(self.tokens) else self.tokens[-1]
+    def peek_value_lower(self, offset: int = 1) -> str:
+        """Lowercased word offset tokens ahead ("" if it is not a WORD)."""
+        return self._words[self.pos + offset]
 
     def advance(self) -> Token:
         tok = self.tokens[self.pos]
@@ -704,25 +216,56 @@ class Parser:
         return tok
 
     def expect_word(self, *words: str) -> Token:
-        tok = self.advance()
-        if tok.type != WORD or tok.value.lower() not in [w.lower() for w in words]:
-            expected = " or ".join(f"'{w}'" for w in words)
-            raise ParseError(f"Line {tok.line}: I expected {expected} but found '{tok.value}'.")
-        return tok
+        pos = self.pos
+        if self._words[pos] in words:
+            # A match is a WORD, never the final EOF, so there is a token after it.
+            self.pos = pos + 1
+            return self.tokens[pos]
+        return self._expect_word_fail(words)
+
+    def _expect_word_fail(self, words: tuple) -> Token:
+        """The cold half of expect_word: a capitalised spelling, or an error."""
+        pos = self.pos
+        if self._words[pos] in [w.lower() for w in words]:
+            self.pos = pos + 1
+            return self.tokens[pos]
+        tok = self.tokens[pos]
+        expected = " or ".join(f"'{w}'" for w in words)
+        raise ParseError(tok.line, f"I expected {expected} but found '{tok.value}'.")
+
+    def expect_words(self, *words: str) -> None:
+        """Consume a fixed run of words, e.g. expect_words("do", "the", "following").
+
+        Matching is case-insensitive. Lowercase words compare directly against
+        the word list; capitalised ones ("End") are kept for error messages
+        and looked up in _LOWERED rather than lowered on every call.
+        """
+        got = self._words
+        p = self.pos
+        for w in words:
+            if got[p] != w and got[p] != _LOWERED.get(w):
+                self.pos = p
+                self.expect_word(w)  # raises with the usual message
+            p += 1
+        self.pos = p
 
     def expect_period(self):
         tok = self.advance()
         if tok.type != PERIOD:
-            raise ParseError(f"Line {tok.line}: I expected a period to end the statement but found '{tok.value}'.")
+            raise ParseError(tok.line, f"I expected a period to end the statement but found '{tok.value}'.")
 
     def expect_rbrace(self):
         tok = self.advance()
         if tok.type != RBRACE:
-            raise ParseError(f"Line {tok.line}: I expected a closing '}}' but found '{tok.value}'.")
+            raise ParseError(tok.line, f"I expected a closing '}}' but found '{tok.value}'.")
 
     def word_is(self, *words: str) -> bool:
-        tok = self.current()
-        return tok.type == WORD and tok.value.lower() in [w.lower() for w in words]
+        """True if the current token is one of words (given in lowercase)."""
+        return self._words[self.pos] in words
+
+    def word_in(self, words: frozenset) -> bool:
+        """word_is for a prebuilt set of lowercase words."""
+        return self._words[self.pos] in words
 
     def match_word(self, *words: str) -> bool:
         if self.word_is(*words):
@@ -734,20 +277,29 @@ class Parser:
 
     def parse(self) -> List[Any]:
         statements = []
-        while self.current().type != EOF:
+        while self._types[self.pos] != EOF:
             stmt = self.parse_statement()
             if stmt is not None:
                 statements.append(stmt)
         return statements
 
-    def parse_block(self, end_keywords: List[str]) -> List[Any]:
+    def parse_block(self, end_words: frozenset) -> List[Any]:
+        # end_words is one of the module-level _BLOCK_* sets of lowercase
+        # words. The statement count is not known until the block has been
+        # parsed (nested blocks hide their own End words), so the list simply
+        # grows. This loop runs once per statement in the program, so the
+        # lookups it makes are bound once.
         statements = []
-        while self.current().type != EOF:
-            if self.word_is(*end_keywords):
+        append = statements.append
+        types = self._types
+        words = self._words
+        parse_statement = self.parse_statement
+        while types[self.pos] != EOF:
+            if words[self.pos] in end_words:
                 break
-            stmt = self.parse_statement()
+            stmt = parse_statement()
             if stmt is not None:
-                statements.append(stmt)
+                append(stmt)
         return statements
 
     # ── Statement dispatch ─────────────────────────────────────────────────────
@@ -760,62 +312,36 @@ class Parser:
             return None
 
         if tok.type != WORD:
-            raise ParseError(f"Line {line}: I expected a keyword to start a statement but found '{tok.value}'.")
-
-        kw = tok.value.lower()
-
-        if kw == "let":        return self.parse_let()
-        elif kw == "display":  return self.parse_display()
-        elif kw == "say":      return self.parse_say()
-        elif kw == "ask":      return self.parse_ask()
-        elif kw == "if":       return self.parse_if()
-        elif kw == "repeat":   return self.parse_repeat()
-        elif kw == "while":    return self.parse_while()
-        elif kw == "for":      return self.parse_for_each()
-        elif kw == "define":   return self.parse_define()
-        elif kw == "call":     return self.parse_call_stmt()
-        elif kw == "give":     return self.parse_give_back()
-        elif kw == "add":      return self.parse_add_dispatch()
-        elif kw == "set":      return self.parse_set_stmt_dispatch()
-        elif kw == "write":    return self.parse_write_file()
-        elif kw == "append":   return self.parse_append_file()
-        elif kw == "import":   return self.parse_import()
-        elif kw == "throw":    return self.parse_throw()
-        elif kw == "attempt":  return self.parse_attempt()
-        elif kw == "remove":
-            if self.peek_ahead().type == WORD and self.peek_ahead().value.lower() == "the":
-                return self.parse_remove_dict()
-            else:
-                return self.parse_remove_from_list()
-        elif kw == "stop":
-            self.advance()
-            self.expect_word("loop")
-            self.expect_period()
-            return StopStmt(line)
-        elif kw == "skip":
-            self.advance()
-            self.expect_word("to")
-            self.expect_word("next")
-            self.expect_period()
-            return SkipStmt(line)
-        elif kw == "try":    return self.parse_try()
-        elif kw == "sort":   return self.parse_sort_list()
-        # Phase 6
-        elif kw == "check":  return self.parse_check()
-        elif kw == "test":   return self.parse_test_block()
-        elif kw == "assert": return self.parse_assert()
-        elif kw == "run":    return self.parse_run_dispatch()
-        # Phase A — GUI statements
-        elif kw == "create": return self.parse_create_window()
-        elif kw == "add":    return self.parse_add_dispatch()
-        # Phase B — Beginner features
-        elif kw == "when":   return self.parse_when_stmt()
-        else:
+            raise ParseError(line, f"I expected a keyword to start a statement but found '{tok.value}'.")
+
+        handler = _STMT_DISPATCH.get(self._words[self.pos])
+        if handler is None:
             raise ParseError(
-                f"Line {line}: I do not understand the keyword '{tok.value}'. "
+                line, f"I do not understand the keyword '{tok.value}'. "
                 f"💡 Common keywords: Let, Say, If, While, Repeat, For, Define, Call, "
                 f"Add, Set, Remove, Write, Append, Import, Create, Run, When, Stop, Skip."
             )
+        return handler(self)
+
+    def parse_remove(self) -> Any:
+        # "Remove the value for K from D." vs "Remove item N from L."
+        if self.peek_value_lower() == "the":
+            return self.parse_remove_dict()
+        return self.parse_remove_from_list()
+
+    def parse_stop(self) -> StopStmt:
+        line = self.current().line
+        self.advance()
+        self.expect_word("loop")
+        self.expect_period()
+        return StopStmt(line)
+
+    def parse_skip(self) -> SkipStmt:
+        line = self.current().line
+        self.advance()
+        self.expect_words("to", "next")
+        self.expect_period()
+        return SkipStmt(line)
 
     # ── Let ───────────────────────────────────────────────────────────────────
 
@@ -825,67 +351,65 @@ class Parser:
 
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: After 'Let' I expected a variable name.")
+            raise ParseError(line, "After 'Let' I expected a variable name.")
         var_name = name_tok.value
         self.expect_word("be")
 
         # "Let X be the result of calling F [on obj] with args [then call G with args]."
-        if self.word_is("the"):
-            saved = self.pos
-            self.advance()
-            if self.word_is("result"):
-                self.advance()
-                if self.word_is("of"):
-                    self.advance()
-                    if self.word_is("calling"):
-                        self.advance()
-                        func_tok = self.advance()
-                        if func_tok.type != WORD:
-                            raise ParseError(f"Line {line}: Expected function name after 'calling'.")
-                        func_name = func_tok.value
-                        
-                        obj_expr = None
-                        if self.word_is("on"):
-                            self.advance()
-                            obj_expr = self.parse_expr()
-                            
-                        args = [] # Initialize args
-                        if self.word_is("with"):
-                            self.advance()
-                            if self.word_is("no") and self.peek_ahead().value.lower() == "parameters":
-                                self.advance() # "no"
-                                self.advance() # "parameters"
-                            else:
-                                args = self.parse_arg_list()
-                                
-                        chained_calls = []
-                        while self.word_is("then"):
-                            self.advance()
-                            self.expect_word("call")
-                            c_name_tok = self.advance()
-                            if c_name_tok.type != WORD:
-                                 raise ParseError(f"Line {self.current().line}: Expected a method name after 'then call'.")
-                            c_name = c_name_tok.value
-                            c_line = c_name_tok.line
-                            c_args = []
-                            if self.word_is("with"):
-                                 self.advance()
-                                 if self.word_is("no") and self.peek_ahead().value.lower() == "parameters":
-                                     self.advance(); self.advance()
-                                 else:
-                                     c_args = self.parse_arg_list()
-                            chained_calls.append((c_name, c_args, c_line))
-                                     
-                        self.expect_period()
-                        return LetResultStmt(var_name, func_name, args, line, obj_expr, chained_calls)
-            
-            # roll back "the" if it wasn't a LetResultStmt
-            self.pos = saved
+        # Decided from the next four words so nothing has to be rolled back.
+        p = self.pos
+        words = self._words
+        if (words[p] == "the" and words[p + 1] == "result"
+                and words[p + 2] == "of" and words[p + 3] == "calling"):
+            self.pos = p + 4
+            return self.parse_let_result(var_name, line)
 
         expr = self.parse_expr()
         self.expect_period()
         return LetStmt(var_name, expr, line)
 
+    def parse_let_result(self, var_name: str, line: int) -> LetResultStmt:
+        """Rest of 'Let X be the result of calling …', after 'calling'."""
+        func_tok = self.advance()
+        if func_tok.type != WORD:
+            raise ParseError(line, "Expected function name after 'calling'.")
+        func_name = func_tok.value
+
+        obj_expr = None
+        if self.word_is("on"):
+            self.advance()
+            obj_expr = self.parse_expr()
+
+        args = [] # Initialize args
+        if self.word_is("with"):
+            self.advance()
+            if self.word_is("no") and self.peek_value_lower() == "parameters":
+                self.advance() # "no"
+                self.advance() # "parameters"
+            else:
+                args = self.parse_arg_list()
+
+        chained_calls = []
+        while self.word_is("then"):
+            self.advance()
+            self.expect_word("call")
+            c_name_tok = self.advance()
+            if c_name_tok.type != WORD:
+                 raise ParseError(self.current().line, "Expected a method name after 'then call'.")
+            c_name = c_name_tok.value
+            c_line = c_name_tok.line
+            c_args = []
+            if self.word_is("with"):
+                 self.advance()
+                 if self.word_is("no") and self.peek_value_lower() == "parameters":
+                     self.pos += 2  # "no parameters"
+                 else:
+                     c_args = self.parse_arg_list()
+            chained_calls.append((c_name, c_args, c_line))
+
+        self.expect_period()
+        return LetResultStmt(var_name, func_name, args, obj_expr, chained_calls, line)
+
     # ── Display ───────────────────────────────────────────────────────────────
 
     def parse_display(self) -> DisplayStmt:
@@ -901,7 +425,7 @@ class Parser:
         line = self.current().line
         self.advance()
         parts = [self.parse_say_part()]
-        while self.current().type == COMMA:
+        while self._types[self.pos] == COMMA:
             self.advance()
             parts.append(self.parse_say_part())
         self.expect_period()
@@ -915,38 +439,36 @@ class Parser:
         """
         tok = self.current()
 
-        # Unambiguous built-in expression starters
-        ALWAYS_EXPR = {"uppercase", "lowercase", "item", "an", "length"}
         # A standalone NUMBER (followed by comma/period/EOF) → evaluated expression.
         # A standalone negative number (-NUMBER) → also evaluated expression.
         # A NUMBER followed by WORDs (e.g. "3 plus 5 equals") → literal text label.
+        p = self.pos
+        types = self._types
+        words = self._words
+        word = words[p]
         is_num = tok.type == NUMBER
-        is_neg_num = tok.type == MINUS and self.peek_ahead().type == NUMBER
+        is_neg_num = tok.type == MINUS and types[p + 1] == NUMBER
 
         if is_num or is_neg_num:
             # Check the token after the number
-            next_tok = self.peek_ahead() if is_num else self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else Token(EOF, "", tok.line)
-            if next_tok.type in (COMMA, PERIOD, EOF):
+            if types[p + 1] in (COMMA, PERIOD, EOF):
                 return self.parse_expr()
             # else fall through to word collector below
-        if tok.type == WORD and tok.value.lower() in ALWAYS_EXPR:
+        if word in _SAY_EXPR_WORDS:
             return self.parse_expr()
         # "a list containing …" or "a list"
-        if tok.type == WORD and tok.value.lower() == "a":
-            if self.peek_ahead().type == WORD and self.peek_ahead().value.lower() in ("list", "empty"):
+        if word == "a":
+            if words[p + 1] in ("list", "empty"):
                 return self.parse_expr()
         # "the length of …", "the keys of ...", "the X of Y", etc.
-        if tok.type == WORD and tok.value.lower() == "the":
-            nxt_tok = self.peek_ahead()
-            if nxt_tok.type == WORD:
-                nxt = nxt_tok.value.lower()
+        if word == "the":
+            nxt = words[p + 1]
+            if nxt:
                 if nxt in ("length", "json", "result", "keys", "value", "contents", "current"):
                     return self.parse_expr()
                 # Check for "the [prop] of [obj]"
-                if self.pos + 2 < len(self.tokens):
-                    after_nxt = self.tokens[self.pos + 2].value.lower() if self.tokens[self.pos+2].type == WORD else ""
-                    if after_nxt == "of":
-                        return self.parse_expr()
+                if words[p + 2] == "of":
+                    return self.parse_expr()
                 
         # Explicit String syntax
         if tok.type == STRING_QUOTED:
@@ -955,36 +477,31 @@ class Parser:
             return self.parse_expr()
 
         # Otherwise: collect words until comma/period
-        words = []
-        while self.current().type not in (COMMA, PERIOD, EOF):
-            t = self.current()
-            if t.type in (NUMBER, WORD):
-                words.append(t.value)
-                self.advance()
-            else:
-                break
-        if not words:
-            raise ParseError(f"Line {self.current().line}: Nothing to say here.")
-        if len(words) == 1:
-            w = words[0]
-            if w.lower() == "true":  return BoolLiteral(True)
-            if w.lower() == "false": return BoolLiteral(False)
+        end = _scan_words(types, p)
+        if end == p:
+            raise ParseError(tok.line, "Nothing to say here.")
+        self.pos = end
+        parts = [t.value for t in self.tokens[p:end]]
+        if len(parts) == 1:
+            w = parts[0]
+            low = words[p]
+            if low == "true":  return _TRUE
+            if low == "false": return _FALSE
+            if w in _SMALL_INTS: return _SMALL_INTS[w]
             try: return NumberLiteral(float(w))
             except ValueError: pass
             return Identifier(w)
-        return StringLiteral(" ".join(words))
+        return StringLiteral(" ".join(parts))
 
     # ── Ask ───────────────────────────────────────────────────────────────────
 
     def parse_ask(self) -> AskStmt:
         line = self.current().line
         self.advance()
-        self.expect_word("the")
-        self.expect_word("user")
-        self.expect_word("for")
+        self.expect_words("the", "user", "for")
         var_tok = self.advance()
         if var_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a variable name after 'Ask the user for'.")
+            raise ParseError(line, "Expected a variable name after 'Ask the user for'.")
         self.expect_period()
         return AskStmt(var_tok.value, line)
 
@@ -994,22 +511,16 @@ class Parser:
         line = self.current().line
         self.advance()
         condition = self.parse_compound_condition()
-        self.expect_word("then")
-        self.expect_word("do")
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("then", "do", "the", "following")
         self.expect_period()
-        then_body = self.parse_block(["Otherwise", "End"])
+        then_body = self.parse_block(_BLOCK_IF_END)
         else_body = []
-        if self.word_is("Otherwise"):
+        if self.word_is("otherwise"):
             self.advance()
-            self.expect_word("do")
-            self.expect_word("the")
-            self.expect_word("following")
+            self.expect_words("do", "the", "following")
             self.expect_period()
-            else_body = self.parse_block(["End"])
-        self.expect_word("End")
-        self.expect_word("if")
+            else_body = self.parse_block(_BLOCK_END)
+        self.expect_words("End", "if")
         self.expect_period()
         return IfStmt(condition, then_body, else_body, line)
 
@@ -1019,14 +530,10 @@ class Parser:
         line = self.current().line
         self.advance()
         count = self.parse_factor()   # allow variable, not just literal
-        self.expect_word("times")
-        self.expect_word("do")
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("times", "do", "the", "following")
         self.expect_period()
-        body = self.parse_block(["End"])
-        self.expect_word("End")
-        self.expect_word("repeat")
+        body = self.parse_block(_BLOCK_END)
+        self.expect_words("End", "repeat")
         self.expect_period()
         return RepeatStmt(count, body, line)
 
@@ -1036,13 +543,10 @@ class Parser:
         line = self.current().line
         self.advance()
         condition = self.parse_compound_condition()
-        self.expect_word("do")
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("do", "the", "following")
         self.expect_period()
-        body = self.parse_block(["End"])
-        self.expect_word("End")
-        self.expect_word("while")
+        body = self.parse_block(_BLOCK_END)
+        self.expect_words("End", "while")
         self.expect_period()
         return WhileStmt(condition, body, line)
 
@@ -1054,7 +558,7 @@ class Parser:
         self.expect_word("each")
         var_tok = self.advance()
         if var_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a variable name after 'For each'.")
+            raise ParseError(line, "Expected a variable name after 'For each'.")
         var_name = var_tok.value
 
         if self.word_is("from"):
@@ -1067,11 +571,9 @@ class Parser:
             if self.word_is("step"):
                 self.advance()
                 step_expr = self.parse_expr()
-            self.expect_word("do")
-            self.expect_word("the")
-            self.expect_word("following")
+            self.expect_words("do", "the", "following")
             self.expect_period()
-            body = self.parse_block(["End"])
+            body = self.parse_block(_BLOCK_END)
             self.advance()  # "End"
             self.expect_word("for")
             self.expect_period()
@@ -1080,11 +582,9 @@ class Parser:
             # Original: "For each X in ITERABLE do the following."
             self.expect_word("in")
             iterable = self.parse_expr()
-            self.expect_word("do")
-            self.expect_word("the")
-            self.expect_word("following")
+            self.expect_words("do", "the", "following")
             self.expect_period()
-            body = self.parse_block(["End"])
+            body = self.parse_block(_BLOCK_END)
             self.advance()  # "End"
             self.expect_word("for")
             self.expect_period()
@@ -1099,68 +599,69 @@ class Parser:
         if self.word_is("a") or self.word_is("an"):
             self.advance()
         else:
-            raise ParseError(f"Line {line}: Expected 'a' or 'an' after 'Define'.")
+            raise ParseError(line, "Expected 'a' or 'an' after 'Define'.")
             
         is_async = False
         if self.word_is("async"):
             is_async = True
             self.advance()
         
-        nxt = self.current().value.lower()
+        nxt = self._words[self.pos]
         if nxt == "function":
-            func_def = self.parse_function_def_rest(line)
-            func_def.is_async = is_async
-            return func_def
-        elif nxt == "class":
-            return self.parse_class_def(line)
-        elif nxt == "method":
-            return self.parse_method_def(line)
-        elif nxt == "enum":
-            return self.parse_enum_def(line)
-        else:
-            raise ParseError(f"Line {line}: Expected 'function', 'class', 'method', or 'enum' after 'Define a/an'.")
+            return self.parse_function_def_rest(line, is_async)
+        handler = _DEFINE_DISPATCH.get(nxt)
+        if handler is None:
+            raise ParseError(line, "Expected 'function', 'class', 'method', or 'enum' after 'Define a/an'.")
+        return handler(self, line)
 
-    def parse_function_def_rest(self, line: int) -> FunctionDef:
+    def parse_function_def_rest(self, line: int, is_async: bool = False) -> FunctionDef:
         self.advance()  # "function"
         self.expect_word("called")
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a function name after 'called'.")
+            raise ParseError(line, "Expected a function name after 'called'.")
         func_name = name_tok.value
+        params = self._parse_signature()
+        body = self._parse_does_block("function")
+        return FunctionDef(func_name, params, body, is_async, line)
 
-        # "that takes X and does" or "with no parameters and does"
+    def _parse_signature(self) -> List[ParamDef]:
+        # "that takes X and" / "that takes no parameters and" / "that with no parameters and"
         self.expect_word("that")
         params = []
         if self.word_is("takes"):
-            self.advance()
-            if self.word_is("no"):
-                self.advance()
-                self.expect_word("parameters")
-                params = []
-            else:
-                params = self.parse_param_list()
+            params = self._parse_takes()
         elif self.word_is("with"):
             self.advance()
-            self.expect_word("no")
-            self.expect_word("parameters")
-            params = []
+            self.expect_words("no", "parameters")
         self.expect_word("and")
-        self.expect_word("does")
-        self.expect_word("the")
-        self.expect_word("following")
+        return params
+
+    def _parse_takes(self) -> List[ParamDef]:
+        # "takes no parameters" or "takes X, Y and Z"
+        self.advance()  # "takes"
+        if self.word_is("no"):
+            self.advance()
+            self.expect_word("parameters")
+            return []
+        return self.parse_param_list()
+
+    def _parse_does_block(self, end_word: str) -> List[Any]:
+        # "does the following." ... "End <end_word>."
+        self.expect_words("does", "the", "following")
         self.expect_period()
-        body = self.parse_block(["End"])
+        body = self.parse_block(_BLOCK_END)
         self.advance() # "End"
-        self.expect_word("function")
+        self.expect_word(end_word)
         self.expect_period()
-        return FunctionDef(func_name, params, body, line)
+        return body
 
     def parse_class_def(self, line: int) -> ClassDef:
         self.advance() # "class"
         self.expect_word("called")
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a class name.")
+            raise ParseError(line, "Expected a class name.")
         class_name = name_tok.value
         
         parent = None
@@ -1169,7 +670,7 @@ class Parser:
             self.expect_word("extends")
             parent_tok = self.advance()
             if parent_tok.type != WORD:
-                raise ParseError(f"Line {line}: Expected a parent class name after 'extends'.")
+                raise ParseError(line, "Expected a parent class name after 'extends'.")
             parent = parent_tok.value
         
         props = []
@@ -1185,10 +686,9 @@ class Parser:
         self.expect_word("called")
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected an enum name.")
+            raise ParseError(line, "Expected an enum name.")
         enum_name = name_tok.value
-        self.expect_word("with")
-        self.expect_word("values")
+        self.expect_words("with", "values")
         values = self.parse_param_list()
         self.expect_period()
         return EnumDef(enum_name, values, line)
@@ -1198,56 +698,43 @@ class Parser:
         self.expect_word("called")
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a method name.")
+            raise ParseError(line, "Expected a method name.")
         method_name = name_tok.value
         
         self.expect_word("for")
         class_tok = self.advance()
         if class_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a class name for the method.")
+            raise ParseError(line, "Expected a class name for the method.")
         class_name = class_tok.value
-        
-        self.expect_word("that")
-        params = []
-        if self.word_is("takes"):
-            self.advance()
-            if self.word_is("no"):
-                self.advance()
-                self.expect_word("parameters")
-                params = []
-            else:
-                params = self.parse_param_list()
-        elif self.word_is("with"):
-            self.advance()
-            self.expect_word("no")
-            self.expect_word("parameters")
-            params = []
-            
-        self.expect_word("and")
-        self.expect_word("does")
-        self.expect_word("the")
-        self.expect_word("following")
-        self.expect_period()
-        
-        body = self.parse_block(["End"])
-        self.advance() # "End"
-        self.expect_word("method")
-        self.expect_period()
+
+        params = self._parse_signature()
+        body = self._parse_does_block("method")
         return MethodDef(class_name, method_name, params, body, line)
 
     def parse_param_list(self) -> List[ParamDef]:
+        tokens = self.tokens
+        types = self._types
+        words = self._words
+        # One plain parameter ("takes x and does ...", "with properties name.")
+        # is the usual case: take it without going round the loop.
+        pos = self.pos
+        if types[pos] == WORD and words[pos] not in _NOT_PARAM_NAME:
+            nxt = pos + 1
+            if types[nxt] == PERIOD or (words[nxt] == "and" and words[nxt + 1] in _PARAM_LIST_END):
+                self.pos = nxt
+                return [ParamDef(tokens[pos].value, None)]
         params = []
         while True:
-            if self.word_is("and"):
-                saved = self.pos
-                self.advance()
-                if self.word_is("does", "following", "with", "gives"):
-                    self.pos = saved
+            pos = self.pos
+            word = words[pos]
+            if word == "and":
+                if words[pos + 1] in _PARAM_LIST_END:
                     break
                 else:
+                    self.pos = pos + 1
                     param_tok = self.advance()
                     if param_tok.type != WORD:
-                        raise ParseError(f"Line {self.current().line}: Expected a parameter name.")
+                        raise ParseError(self.current().line, "Expected a parameter name.")
                     default_expr = None
                     if self.word_is("defaulting"):
                         self.advance()
@@ -1255,10 +742,11 @@ class Parser:
                         default_expr = self.parse_expr()
                     params.append(ParamDef(param_tok.value, default_expr))
                     break
-            elif self.current().type == COMMA:
-                self.advance()
-            elif self.current().type == WORD and not self.word_is("and", "does", "following", "that", "with"):
-                name = self.advance().value
+            elif types[pos] == COMMA:
+                self.pos = pos + 1
+            elif types[pos] == WORD and word not in _NOT_PARAM_NAME:
+                self.pos = pos + 1
+                name = tokens[pos].value
                 default_expr = None
                 if self.word_is("defaulting"):
                     self.advance()
@@ -1276,7 +764,7 @@ class Parser:
         self.advance()
         name_tok = self.advance()
         if name_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a function name after 'Call'.")
+            raise ParseError(line, "Expected a function name after 'Call'.")
         func_name = name_tok.value
 
         obj_expr = None
@@ -1286,7 +774,7 @@ class Parser:
 
         if self.word_is("with"):
             self.advance()
-            if self.word_is("no") and self.peek_ahead().value.lower() == "parameters":
+            if self.word_is("no") and self.peek_value_lower() == "parameters":
                 self.advance() # "no"
                 self.advance() # "parameters"
                 args = []
@@ -1301,42 +789,70 @@ class Parser:
             self.expect_word("call")
             c_name_tok = self.advance()
             if c_name_tok.type != WORD:
-                 raise ParseError(f"Line {self.current().line}: Expected a method name after 'then call'.")
+                 raise ParseError(self.current().line, "Expected a method name after 'then call'.")
             c_name = c_name_tok.value
             c_line = c_name_tok.line
             c_args = []
             if self.word_is("with"):
                  self.advance()
-                 if self.word_is("no") and self.peek_ahead().value.lower() == "parameters":
-                     self.advance(); self.advance()
+                 if self.word_is("no") and self.peek_value_lower() == "parameters":
+                     self.pos += 2  # "no parameters"
                  else:
                      c_args = self.parse_arg_list()
             chained_calls.append((c_name, c_args, c_line))
 
         self.expect_period()
-        return CallStmt(func_name, args, line, obj_expr, chained_calls)
+        return CallStmt(func_name, args, obj_expr, chained_calls, line)
 
     def parse_arg_list(self) -> List[Any]:
-        args = [self.parse_expr()]
-        while self.current().type == COMMA:
-            self.advance()
-            args.append(self.parse_expr())
-        return args
+        # Most arguments are a lone number or name. When one is directly
+        # followed by ',' or '.', build its node here instead of descending
+        # through parse_expr → parse_factor.
+        tokens = self.tokens
+        types = self._types
+        words = self._words
+        args = []
+        append = args.append
+        parse_expr = self.parse_expr
+        while True:
+            p = self.pos
+            t = types[p]
+            after = types[p + 1]
+            if (after == COMMA or after == PERIOD) and (
+                    t == NUMBER or (t == WORD and words[p] not in _FACTOR_WORDS)):
+                tok = tokens[p]
+                if t == NUMBER:
+                    node = _SMALL_INTS.get(tok.value)
+                    if node is None:
+                        node = NumberLiteral(float(tok.value), tok.line)
+                else:
+                    node = Identifier(tok.value, tok.line)
+                append(node)
+                p += 1
+            else:
+                append(parse_expr())
+                p = self.pos
+            if types[p] != COMMA:
+                self.pos = p
+                return args
+            self.pos = p + 1
 
     def parse_dict_arg_list(self) -> List[tuple[Any, Any]]:
+        types = self._types
+        parse_expr = self.parse_expr
         pairs = []
+        append = pairs.append
         while True:
-            key_expr = self.parse_expr()
-            if self.current().type != COLON:
-                raise ParseError(f"Line {self.current().line}: Expected a colon ':' after dictionary key.")
-            self.advance()
-            value_expr = self.parse_expr()
-            pairs.append((key_expr, value_expr))
-            if self.current().type == COMMA:
-                self.advance()
-            else:
-                break
-        return pairs
+            key_expr = parse_expr()
+            pos = self.pos
+            if types[pos] != COLON:
+                raise ParseError(self.tokens[pos].line, "Expected a colon ':' after dictionary key.")
+            self.pos = pos + 1
+            append((key_expr, parse_expr()))
+            pos = self.pos
+            if types[pos] != COMMA:
+                return pairs
+            self.pos = pos + 1
 
     # ── Give Back ────────────────────────────────────────────────────────────
 
@@ -1357,7 +873,7 @@ class Parser:
         self.expect_word("to")
         list_tok = self.advance()
         if list_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a list variable name after 'to'.")
+            raise ParseError(line, "Expected a list variable name after 'to'.")
         self.expect_period()
         return AddToListStmt(value, list_tok.value, line)
 
@@ -1371,7 +887,7 @@ class Parser:
         self.expect_word("from")
         list_tok = self.advance()
         if list_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a list variable name after 'from'.")
+            raise ParseError(line, "Expected a list variable name after 'from'.")
         self.expect_period()
         return RemoveFromListStmt(index, list_tok.value, line)
 
@@ -1383,7 +899,7 @@ class Parser:
         self.expect_word("the")
         
         # Look ahead to see if it's dictionary value or object property
-        if self.word_is("value") and self.peek_ahead().value.lower() == "for":
+        if self.word_is("value") and self.peek_value_lower() == "for":
             # Dictionary case: Set the value for K in D to V.
             self.advance() # "value"
             self.expect_word("for")
@@ -1398,7 +914,7 @@ class Parser:
             # Object property case: Set the age of p to 31.
             prop_tok = self.advance()
             if prop_tok.type != WORD:
-                raise ParseError(f"Line {line}: Expected a property name after 'the'.")
+                raise ParseError(line, "Expected a property name after 'the'.")
             prop_name = prop_tok.value
             self.expect_word("of")
             obj_expr = self.parse_expr()
@@ -1410,9 +926,7 @@ class Parser:
     def parse_remove_dict(self) -> RemoveDictValueStmt:
         line = self.current().line
         self.advance()  # "Remove"
-        self.expect_word("the")
-        self.expect_word("value")
-        self.expect_word("for")
+        self.expect_words("the", "value", "for")
         key_expr = self.parse_expr()
         self.expect_word("in")
         dict_expr = self.parse_expr()
@@ -1427,8 +941,7 @@ class Parser:
         line = self.current().line
         self.advance()  # "Write"
         content_expr = self.parse_expr()
-        self.expect_word("to")
-        self.expect_word("file")
+        self.expect_words("to", "file")
         file_expr = self.parse_expr()
         self.expect_period()
         return WriteFileStmt(content_expr, file_expr, line)
@@ -1437,8 +950,7 @@ class Parser:
         line = self.current().line
         self.advance()  # "Append"
         content_expr = self.parse_expr()
-        self.expect_word("to")
-        self.expect_word("file")
+        self.expect_words("to", "file")
         file_expr = self.parse_expr()
         self.expect_period()
         return AppendFileStmt(content_expr, file_expr, line)
@@ -1448,15 +960,15 @@ class Parser:
         self.advance()  # "Import"
         
         specific_imports = None
-        if self.current().type == LBRACE:
+        if self._types[self.pos] == LBRACE:
             self.advance() # "{"
             specific_imports = []
-            while self.current().type != RBRACE:
+            while self._types[self.pos] != RBRACE:
                 name_tok = self.advance()
                 if name_tok.type != WORD:
-                    raise ParseError(f"Line {line}: Expected an identifier to import.")
+                    raise ParseError(line, "Expected an identifier to import.")
                 specific_imports.append(name_tok.value)
-                if self.current().type == COMMA:
+                if self._types[self.pos] == COMMA:
                     self.advance()
             self.expect_rbrace()
             self.expect_word("from")
@@ -1472,7 +984,7 @@ class Parser:
             self.advance()
             alias_tok = self.advance()
             if alias_tok.type != WORD:
-                raise ParseError(f"Line {line}: Expected an alias name after 'as'.")
+                raise ParseError(line, "Expected an alias name after 'as'.")
             alias = alias_tok.value
             
         self.expect_period()
@@ -1489,24 +1001,20 @@ class Parser:
     def parse_attempt(self) -> AttemptStmt:
         line = self.current().line
         self.advance() # "Attempt"
-        self.expect_word("to")
-        self.expect_word("do")
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("to", "do", "the", "following")
         self.expect_period()
         
-        try_body = self.parse_block(["Rescue"])
-        
-        self.advance() # "Rescue"
-        self.expect_word("error")
-        self.expect_word("as")
+        # parse_block stops at "Rescue" (or at the end of the file, which
+        # expect_words then reports), and the preamble follows straight on.
+        try_body = self.parse_block(_BLOCK_TRY_END)
+        self.expect_words("Rescue", "error", "as")
         var_tok = self.advance()
         if var_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a variable name after 'as'.")
+            raise ParseError(line, "Expected a variable name after 'as'.")
         error_var = var_tok.value
         self.expect_period()
         
-        catch_body = self.parse_block(["End"])
+        catch_body = self.parse_block(_BLOCK_END)
         
         self.advance() # "End"
         self.expect_word("attempt")
@@ -1520,18 +1028,34 @@ class Parser:
         return self.parse_compound_condition()
 
     def parse_compound_condition(self) -> Any:
-        line = self.current().line
-        left = self.parse_single_condition()
-        while self.word_is("and", "or"):
-            connective = self.advance().value.lower()
-            right = self.parse_single_condition()
-            left = CompoundCondition(left, connective, right, line)
+        tokens = self.tokens
+        line = tokens[self.pos].line
+        parse_single_condition = self.parse_single_condition
+        left = parse_single_condition()
+        # A run of the same connective extends one n-ary node; switching
+        # connective wraps what we have so far (left-associative, as before).
+        compound = None
+        while True:
+            pos = self.pos
+            tok = tokens[pos]
+            if tok.type != WORD:
+                break
+            connective = tok.value_lower
+            if connective != "and" and connective != "or":
+                break
+            self.pos = pos + 1
+            right = parse_single_condition()
+            if compound is not None and compound.connective == connective:
+                compound.operands.append(right)
+            else:
+                compound = CompoundCondition(connective, [left, right], line)
+                left = compound
         return left
 
     # ── Single Condition ──────────────────────────────────────────────────────
 
     def parse_single_condition(self) -> Condition:
-        line = self.current().line
+        line = self.tokens[self.pos].line
 
         # "file F exists"
         if self.word_is("file"):
@@ -1545,76 +1069,71 @@ class Parser:
 
         # If parse_expr already consumed a full boolean expr (ContainsExpr, etc.),
         # just return it directly — no comparison operator needed.
-        boolean_expr_types = ("ContainsExpr", "StartsWithExpr", "EndsWithExpr", "BoolLiteral")
-        if type(left).__name__ in boolean_expr_types:
+        if isinstance(left, _BOOL_EXPR_TYPES):
             return left
 
         # ── Symbol operators ──────────────────────────────────────────────────
-        if tok.type == GT:
-            self.advance(); op = "greater_than"
-        elif tok.type == GTE:
-            self.advance(); op = "greater_equal"
-        elif tok.type == LT:
-            self.advance(); op = "less_than"
-        elif tok.type == LTE:
-            self.advance(); op = "less_equal"
-        elif tok.type == EQ:
-            self.advance(); op = "equals"
-        elif tok.type == NEQ:
-            self.advance(); op = "not_equals"
+        op = _COMPARE_SYMBOLS.get(tok.type)
+        if op is not None:
+            self.advance()
+            right = self.parse_expr()
+            return Condition(left, op, right, line)
 
         # ── English operators ─────────────────────────────────────────────────
-        elif self.word_is("equals"):
+        # Each level reads the current word once and compares it locally.
+        words = self._words
+        word = words[self.pos]
+        if word == "equals":
             self.advance(); op = "equals"
-        elif self.word_is("is"):
+        elif word == "is":
             self.advance()
-            if self.word_is("greater"):
-                self.advance(); self.expect_word("than")
+            word = words[self.pos]
+            if word == "greater":
+                self.expect_words("greater", "than")
                 if self.word_is("or"):
-                    self.advance(); self.expect_word("equal"); self.expect_word("to")
+                    self.expect_words("or", "equal", "to")
                     op = "greater_equal"
                 else:
                     op = "greater_than"
-            elif self.word_is("less"):
-                self.advance(); self.expect_word("than")
+            elif word == "less":
+                self.expect_words("less", "than")
                 if self.word_is("or"):
-                    self.advance(); self.expect_word("equal"); self.expect_word("to")
+                    self.expect_words("or", "equal", "to")
                     op = "less_equal"
                 else:
                     op = "less_than"
-            elif self.word_is("equal"):
-                self.advance(); self.expect_word("to"); op = "equals"
-            elif self.word_is("not"):
+            elif word == "equal":
+                self.expect_words("equal", "to"); op = "equals"
+            elif word == "not":
                 self.advance()
                 if self.word_is("equal"):
-                    self.advance(); self.expect_word("to"); op = "not_equals"
+                    self.expect_words("equal", "to"); op = "not_equals"
                 else:
                     op = "not_equals"   # bare "is not X"
             # ── Type checks — "X is a number / text / list / boolean" ─────────
-            elif self.word_is("a"):
+            elif word == "a":
                 self.advance()
                 type_tok = self.advance()
-                type_word = type_tok.value.lower()
-                if type_word not in ("number", "text", "list", "boolean"):
+                type_word = type_tok.value_lower
+                if type_word not in _TYPE_WORDS:
                     raise ParseError(
-                        f"Line {line}: After 'is a' I expected 'number', 'text', 'list', or 'boolean' "
+                        line, "After 'is a' I expected 'number', 'text', 'list', or 'boolean' "
                         f"but found '{type_tok.value}'."
                     )
-                return Condition(left, f"is_{type_word}", None, line)
+                return Condition(left, _intern(f"is_{type_word}"), None, line)
             # bare "is number / text / list / boolean" (without 'a')
-            elif self.word_is("number", "text", "list", "boolean"):
-                type_word = self.advance().value.lower()
-                return Condition(left, f"is_{type_word}", None, line)
+            elif word in _TYPE_WORDS:
+                self.advance()
+                return Condition(left, _intern(f"is_{word}"), None, line)
             else:
                 op = "equals"  # bare "is X"
-        elif self.word_is("has"):
+        elif word == "has":
             self.advance()
-            self.expect_word("the")
-            self.expect_word("key")
+            self.expect_words("the", "key")
             op = "has_key"
         else:
             raise ParseError(
-                f"Line {line}: I expected a comparison operator "
+                line, "I expected a comparison operator "
                 f"(like 'is greater than', '>', '=', etc.) but found '{tok.value}'."
             )
 
@@ -1623,581 +1142,587 @@ class Parser:
 
     # ── Expression (arithmetic) ───────────────────────────────────────────────
 
-    def parse_expr(self) -> Any:
-        """expr := term {('+' | '-' | 'plus' | 'minus') term} ... plus Phase 3 infix ops"""
-        line = self.current().line
-        left = self.parse_term()
+    def parse_expr(self, min_prec: int = 0) -> Any:
+        """expr := term {('+' | '-' | 'plus' | 'minus') term} ... plus Phase 3 infix ops
+        term := factor {('*'|'/'|'%'|'times'|'divided by'|'modulo') factor}
+
+        Both levels are parsed here by precedence climbing: an operator that
+        binds at least as tightly as min_prec takes parse_expr(prec + 1) as
+        its right operand. Only the outermost call handles 'contains' and 'as'.
+        """
+        line = self.tokens[self.pos].line
+        types = self._types
+        words = self._words
+        left = self.parse_factor()
 
         while True:
-            if self.word_is("plus", "minus") or self.current().type in (PLUS, MINUS):
-                tok = self.advance()
-                op = "plus" if tok.value in ("+", "plus") else "minus"
-                right = self.parse_term()
+            pos = self.pos
+            val = words[pos]
+            entry = _BINARY_OPS.get(types[pos]) or _BINARY_WORDS.get(val)
+
+            if entry is not None:
+                op, prec = entry
+                if prec < min_prec:
+                    break
+                self.pos = pos + 1
+                if val == "divided":
+                    self.expect_word("by")
+                right = self.parse_expr(prec + 1)
                 left = BinOp(left, op, right, line)
 
-            elif self.word_is("contains"):
-                self.advance()
+            elif min_prec:
+                break
+
+            elif val == "contains":
+                self.pos = pos + 1
                 right = self.parse_expr()
                 # Determine if left is a list or string by falling back to ContainsExpr, 
                 # which handles both dynamically in the interpreter.
                 left = ContainsExpr(left, right, line)
 
-            elif self.word_is("as"):
-                saved_pos = self.pos
-                self.advance()
-                if self.word_is("a"):
-                    self.advance()
-                if self.word_is("number", "numbers"):
-                    self.advance()
+            elif val == "as":
+                # 'as [a] number' / 'as text': decide from the words ahead and
+                # only then move past them; any other 'as' ends the expression.
+                k = pos + 2 if words[pos + 1] == "a" else pos + 1
+                target = words[k]
+                if target in _NUMBER_WORDS:
                     left = AsNumber(left, line)
-                elif self.word_is("text"):
-                    self.advance()
+                elif target == "text":
                     left = AsText(left, line)
                 else:
-                    # rollback if it isn't 'as a number' or 'as text' (though unlikely)
-                    self.pos = saved_pos
                     break
+                self.pos = k + 1
             else:
                 break
 
         return left
 
-    def parse_term(self) -> Any:
-        """term := factor {('*'|'/'|'%'|'times'|'divided by'|'modulo') factor}"""
-        line = self.current().line
-        left = self.parse_factor()
-        while (self.word_is("times", "divided", "modulo") or
-               self.current().type in (STAR, SLASH, PERCENT)):
-            tok = self.advance()
-            v = tok.value.lower()
-            if v == "/" or tok.type == SLASH:
-                op = "divided_by"
-            elif v == "%" or tok.type == PERCENT:
-                op = "modulo"
-            elif v == "divided":
-                self.expect_word("by")
-                op = "divided_by"
-            elif v == "modulo":
-                op = "modulo"
-            else:
-                op = "times"
-            right = self.parse_factor()
-            left = BinOp(left, op, right, line)
-        return left
-
-    def parse_factor(self) -> Any:
-        tok = self.current()
-        line = tok.line
+    # ── Factor heads ──────────────────────────────────────────────────────────
+    # parse_factor looks these up in _FACTOR_DISPATCH by the leading word. Each
+    # starts on that word and returns None (position unchanged) if the words
+    # that follow are not its phrase, so parse_factor carries on as usual.
+
+    def _factor_true(self, line: int) -> BoolLiteral:
+        self.pos += 1
+        return _TRUE
+
+    def _factor_false(self, line: int) -> BoolLiteral:
+        self.pos += 1
+        return _FALSE
+
+    def _factor_nothing(self, line: int) -> NoneLiteral:
+        # "nothing" or "empty"
+        self.pos += 1
+        return _NONE
+
+    def _factor_a(self, line: int) -> Any:
+        # "a"/"an" followed by one of the nouns in _ARTICLE_DISPATCH; with any
+        # other word after it the article is left to parse_factor.
+        handler = _ARTICLE_DISPATCH.get(self._words[self.pos + 1])
+        if handler is None:
+            return None
+        self.pos += 1  # consume 'a' / 'an'
+        return handler(self, line)
 
-        # ── Unary minus ───────────────────────────────────────────────────────
-        if tok.type == MINUS:
+    def _factor_a_list(self, line: int) -> ListLiteral:
+        # "a list containing X, Y, Z"
+        self.advance()
+        if self.word_is("containing"):
             self.advance()
-            operand = self.parse_factor()
-            return UnaryMinus(operand, line)
+            elements = self.parse_arg_list()
+            return ListLiteral(elements, line)
+        else:
+            return ListLiteral([], line)  # bare "a list"
 
-        # ── Number literal ────────────────────────────────────────────────────
-        if tok.type == NUMBER:
+    def _factor_a_dictionary(self, line: int) -> DictLiteral:
+        # "a dictionary containing K: V"
+        self.advance()
+        if self.word_is("containing"):
             self.advance()
-            return NumberLiteral(float(tok.value), line)
+            pairs = self.parse_dict_arg_list()
+            return DictLiteral(pairs, line)
+        else:
+            return DictLiteral([], line)
 
-        # ── Quoted String literal ─────────────────────────────────────────────
-        if tok.type == STRING_QUOTED:
+    def _factor_a_new(self, line: int) -> NewInstanceExpr:
+        # "a new Person with name: 'Alice', age: 30"
+        self.advance() # "new"
+        class_tok = self.advance()
+        if class_tok.type != WORD:
+            raise ParseError(line, "Expected a class name after 'new'.")
+        class_name = class_tok.value
+        args = []
+        if self.word_is("with"):
             self.advance()
-            return StringLiteral(tok.value, line)
+            args = self.parse_dict_arg_list() # name: value pairs
+        return NewInstanceExpr(class_name, args, line)
 
-        # ── Interpolated String ──────────────────────────────────────────────
-        if tok.type == INTERP_STRING:
+    def _factor_a_function(self, line: int) -> Any:
+        # "a function that takes X and gives back EXPR"     (single-expression lambda)
+        # "a function that takes X and does the following... End function."  (multi-line BlockLambda)
+        self.advance()  # "function"
+        self.expect_word("that")
+        params = []
+        if self.word_is("takes"):
+            params = self._parse_takes()
+        self.expect_word("and")
+        if self.word_is("gives"):
+            # Single-expression form: "and gives back EXPR"
+            self.expect_words("gives", "back")
+            body_expr = self.parse_expr()
+            return LambdaExpr(params, body_expr, line)
+        elif self.word_is("does"):
+            # Multi-line block form: "and does the following...End function."
+            body = self._parse_does_block("function")
+            return BlockLambda(params, body, line=line)
+        else:
+            raise ParseError(line, "Expected 'gives back' or 'does the following' after function parameters.")
+
+    def _factor_a_empty(self, line: int) -> Any:
+        # "an empty list" / "an empty dictionary"
+        self.advance()
+        if self.word_is("list"):
             self.advance()
-            return self._parse_interpolated_string(tok.value, line)
+            return ListLiteral([], line)
+        elif self.word_is("dictionary"):
+            self.advance()
+            return DictLiteral([], line)
+        else:
+            raise ParseError(line, "Expected 'list' or 'dictionary' after 'an empty'.")
 
-        if tok.type == WORD:
-            val = tok.value.lower()
-
-            if val == "true":  self.advance(); return BoolLiteral(True, line)
-            if val == "false": self.advance(); return BoolLiteral(False, line)
-            if val == "nothing" or val == "empty": self.advance(); return NoneLiteral(line)
-
-            # ── Built-in expressions starting with keywords ────────────────────
-
-            # "a list containing X, Y, Z"  or  "an empty list"
-            # "a dictionary containing K: V" or "an empty dictionary"
-            # "a new Person with name: 'Alice', age: 30"
-            # "a function that takes X and gives back EXPR"
-            if (val == "a" or val == "an") and (
-                self.peek_ahead().type == WORD and
-                self.peek_ahead().value.lower() in ("list", "empty", "dictionary", "new", "function")
-            ):
-                self.advance()  # consume 'a' / 'an'
-                nxt = self.current().value.lower()
-                if nxt == "list":
-                    self.advance()
-                    if self.word_is("containing"):
-                        self.advance()
-                        elements = self.parse_arg_list()
-                        return ListLiteral(elements, line)
-                    else:
-                        return ListLiteral([], line)  # bare "a list"
-                elif nxt == "dictionary":
-                    self.advance()
-                    if self.word_is("containing"):
-                        self.advance()
-                        pairs = self.parse_dict_arg_list()
-                        return DictLiteral(pairs, line)
-                    else:
-                        return DictLiteral([], line)
-                elif nxt == "new":
-                    self.advance() # "new"
-                    class_tok = self.advance()
-                    if class_tok.type != WORD:
-                        raise ParseError(f"Line {line}: Expected a class name after 'new'.")
-                    class_name = class_tok.value
-                    args = []
-                    if self.word_is("with"):
-                        self.advance()
-                        args = self.parse_dict_arg_list() # name: value pairs
-                    return NewInstanceExpr(class_name, args, line)
-                elif nxt == "function":
-                    # "a function that takes X and gives back EXPR"     (single-expression lambda)
-                    # "a function that takes X and does the following... End function."  (multi-line BlockLambda)
-                    self.advance()  # "function"
-                    self.expect_word("that")
-                    params = []
-                    if self.word_is("takes"):
-                        self.advance()
-                        if self.word_is("no"):
-                            self.advance()
-                            self.expect_word("parameters")
-                        else:
-                            params = self.parse_param_list()
-                    self.expect_word("and")
-                    if self.word_is("gives"):
-                        # Single-expression form: "and gives back EXPR"
-                        self.expect_word("gives")
-                        self.expect_word("back")
-                        body_expr = self.parse_expr()
-                        return LambdaExpr(params, body_expr, line)
-                    elif self.word_is("does"):
-                        # Multi-line block form: "and does the following...End function."
-                        self.expect_word("does")
-                        self.expect_word("the")
-                        self.expect_word("following")
-                        self.expect_period()
-                        body = self.parse_block(["End"])
-                        self.advance()  # "End"
-                        self.expect_word("function")
-                        self.expect_period()
-                        return BlockLambda(params, body, line)
-                    else:
-                        raise ParseError(f"Line {line}: Expected 'gives back' or 'does the following' after function parameters.")
-                else:  # "empty"
-                    self.advance()
-                    if self.word_is("list"):
-                        self.advance()
-                        return ListLiteral([], line)
-                    elif self.word_is("dictionary"):
-                        self.advance()
-                        return DictLiteral([], line)
-                    else:
-                        raise ParseError(f"Line {line}: Expected 'list' or 'dictionary' after 'an empty'.")
+    def _factor_waiting(self, line: int) -> WaitExpr:
+        # "waiting for X"
+        self.advance() # "waiting"
+        self.expect_word("for")
+        expr = self.parse_expr()
+        return WaitExpr(expr, line)
 
-            # Enum access: "Color Red"
-            # Check if current word is a known identifier followed by another word
-            # This will be handled at interpret-time by checking if it's an enum
+    def _factor_all(self, line: int) -> AllWhereExpr:
+        # "all X in LIST where CONDITION"  (inline filter)
+        self.advance()  # "all"
+        var_tok = self.advance()  # item variable name
+        var_name = var_tok.value
+        self.expect_word("in")
+        source_expr = self.parse_factor()
+        self.expect_word("where")
+        condition = self.parse_condition()   # supports > >= < <= is contains
+        return AllWhereExpr(var_name, source_expr, condition, line)
+
+    def _factor_the(self, line: int) -> Any:
+        # "the length of X", "the current year", "the age of p", ... — the
+        # word after "the" picks the phrase from _THE_DISPATCH; any other
+        # word is a property name.
+        pos = self.pos
+        nxt = self._words[pos + 1]
+        if not nxt:
+            return None
+        handler = _THE_DISPATCH.get(nxt)
+        if handler is not None:
+            # Like the factor heads, the handler starts on "the" and leaves
+            # the position alone if the words after it are not its phrase.
+            return handler(self, line)
+        # General property access: the age of p
+        # We expect "the [prop] of [obj]"; [prop] is a WORD since nxt is set.
+        if self._words[pos + 2] == "of":
+            self.pos = pos + 3
+            obj_expr = self.parse_factor()
+            return PropertyAccessExpr(obj_expr, self.tokens[pos + 1].value, line)
+        return None
+
+    def _factor_the_length(self, line: int) -> LengthOf:
+        # "the length of X"
+        self.pos += 2  # "the length"
+        self.expect_word("of")
+        expr = self.parse_factor()
+        return LengthOf(expr, line)
+
+    def _factor_the_value(self, line: int) -> DictAccess:
+        # "the value for K in D"
+        self.pos += 2  # "the value"
+        self.expect_word("for")
+        key_expr = self.parse_factor()
+        self.expect_word("in")
+        dict_expr = self.parse_factor()
+        return DictAccess(dict_expr, key_expr, line)
+
+    def _factor_the_keys(self, line: int) -> DictKeys:
+        # "the keys of D"
+        self.pos += 2  # "the keys"
+        self.expect_word("of")
+        dict_expr = self.parse_factor()
+        return DictKeys(dict_expr, line)
+
+    def _factor_the_contents(self, line: int) -> FileContents:
+        # "the contents of file F"
+        self.pos += 2  # "the contents"
+        self.expect_words("of", "file")
+        file_expr = self.parse_factor()
+        return FileContents(file_expr, line)
+
+    def _factor_the_current(self, line: int) -> TimeOp:
+        # "the current date and time" / "the current year" / "the current timestamp"
+        self.pos += 2  # "the current"
+        if self.word_is("date"):
+            self.advance()
+            self.expect_words("and", "time")
+            return TimeOp("datetime", line)
+        elif self.word_is("year"):
+            self.advance()
+            return TimeOp("year", line)
+        elif self.word_is("timestamp"):
+            self.advance()
+            return TimeOp("timestamp", line)
+        else:
+            raise ParseError(line, "Expected 'date and time', 'year', or 'timestamp' after 'the current'.")
+
+    def _factor_the_command(self, line: int) -> CliArgsExpr:
+        # "the command line arguments"
+        self.pos += 2  # "the command"
+        self.expect_words("line", "arguments")
+        return CliArgsExpr(line)
+
+    def _factor_the_environment(self, line: int) -> EnvVarExpr:
+        # "the environment variable NAME"
+        self.pos += 2  # "the environment"
+        self.expect_word("variable")
+        name_expr = self.parse_factor()
+        return EnvVarExpr(name_expr, line)
+
+    def _factor_the_json(self, line: int) -> Any:
+        # "the json parsed from text T" / "the json for D"; "the json" alone
+        # is not a phrase, so decide from the word after it before moving.
+        pos = self.pos
+        after = self._words[pos + 2]
+        if after == "parsed":
+            self.pos = pos + 3
+            self.expect_words("from", "text")
+            text_expr = self.parse_factor()
+            return JsonParseExpr(text_expr, line)
+        if after == "for":
+            self.pos = pos + 3
+            dict_expr = self.parse_factor()
+            return JsonStringifyExpr(dict_expr, line)
+        return None
+
+    def _factor_the_result(self, line: int) -> Any:
+        # "the result of <verb> ...", the verb picking from _RESULT_OF_DISPATCH;
+        # anything else is declined without moving.
+        pos = self.pos
+        words = self._words
+        if words[pos + 2] == "of":
+            handler = _RESULT_OF_DISPATCH.get(words[pos + 3])
+            if handler is not None:
+                self.pos = pos + 4
+                return handler(self, line)
+        return None
+
+    def _result_of_fetching(self, line: int) -> HttpGetExpr:
+        # "the result of fetching url U"
+        self.expect_word("url")
+        url_expr = self.parse_factor()
+        return HttpGetExpr(url_expr, line)
+
+    def _result_of_posting(self, line: int) -> HttpPostExpr:
+        # "the result of posting payload P to url U"
+        self.expect_word("payload")
+        payload_expr = self.parse_factor()
+        self.expect_words("to", "url")
+        url_expr = self.parse_factor()
+        return HttpPostExpr(url_expr, payload_expr, line)
+
+    def _result_of_mapping(self, line: int) -> MapExpr:
+        # "the result of mapping F over L"
+        func_expr = self.parse_factor()
+        self.expect_word("over")
+        list_expr = self.parse_factor()
+        return MapExpr(func_expr, list_expr, line)
+
+    def _result_of_filtering(self, line: int) -> FilterExpr:
+        # "the result of filtering L where CONDITION"
+        # The condition uses "item" as the implicit loop variable
+        list_expr = self.parse_factor()
+        self.expect_word("where")
+        cond = self.parse_condition()
+        return FilterExpr(list_expr, "item", cond, line)
 
-            # "waiting for X"
-            if val == "waiting":
-                self.advance() # "waiting"
-                self.expect_word("for")
-                expr = self.parse_expr()
-                return WaitExpr(expr, line)
-
-            # "all X in LIST where CONDITION"  (inline filter)
-            if val == "all":
-                self.advance()  # "all"
-                var_tok = self.advance()  # item variable name
-                var_name = var_tok.value
-                self.expect_word("in")
-                source_expr = self.parse_factor()
-                self.expect_word("where")
-                condition = self.parse_condition()   # supports > >= < <= is contains
-                return AllWhereExpr(var_name, source_expr, condition, line)
-
-            # "the length of X" or "the value for K in D" or "the keys of D"
-            if val == "the" and self.peek_ahead().type == WORD:
-                nxt = self.peek_ahead().value.lower()
-                if nxt == "length":
-                    self.advance(); self.advance()
-                    self.expect_word("of")
-                    expr = self.parse_factor()
-                    return LengthOf(expr, line)
-                elif nxt == "value":
-                    self.advance(); self.advance()
-                    self.expect_word("for")
-                    key_expr = self.parse_factor()
-                    self.expect_word("in")
-                    dict_expr = self.parse_factor()
-                    return DictAccess(dict_expr, key_expr, line)
-                elif nxt == "keys":
-                    self.advance(); self.advance()
-                    self.expect_word("of")
-                    dict_expr = self.parse_factor()
-                    return DictKeys(dict_expr, line)
-                elif nxt == "contents":
-                    self.advance(); self.advance()
-                    self.expect_word("of")
-                    self.expect_word("file")
-                    file_expr = self.parse_factor()
-                    return FileContents(file_expr, line)
-                elif nxt == "current":
-                    self.advance(); self.advance()
-                    if self.word_is("date"):
-                        self.advance()
-                        self.expect_word("and")
-                        self.expect_word("time")
-                        return TimeOp("datetime", line)
-                    elif self.word_is("year"):
-                        self.advance()
-                        return TimeOp("year", line)
-                    elif self.word_is("timestamp"):
-                        self.advance()
-                        return TimeOp("timestamp", line)
-                    else:
-                        raise ParseError(f"Line {line}: Expected 'date and time', 'year', or 'timestamp' after 'the current'.")
-                elif nxt == "command":
-                    # "the command line arguments"
-                    self.advance(); self.advance()  # consume "the" and "command"
-                    self.expect_word("line")
-                    self.expect_word("arguments")
-                    return CliArgsExpr(line)
-                elif nxt == "environment":
-                    # "the environment variable NAME"
-                    self.advance(); self.advance()  # consume "the" and "environment"
-                    self.expect_word("variable")
-                    name_expr = self.parse_factor()
-                    return EnvVarExpr(name_expr, line)
-                elif nxt == "json":
-                    self.advance(); self.advance()
-                    if self.word_is("parsed"):
-                        self.advance()
-                        self.expect_word("from")
-                        self.expect_word("text")
-                        text_expr = self.parse_factor()
-                        return JsonParseExpr(text_expr, line)
-                    if self.word_is("for"):
-                        self.advance()
-                        dict_expr = self.parse_factor()
-                        return JsonStringifyExpr(dict_expr, line)
-                    self.pos -= 2 # rollback
-                elif nxt == "result":
-                    self.advance(); self.advance()
-                    if self.word_is("of"):
-                        self.advance()
-                        if self.word_is("fetching"):
-                            self.advance()
-                            self.expect_word("url")
-                            url_expr = self.parse_factor()
-                            return HttpGetExpr(url_expr, line)
-                        elif self.word_is("posting"):
-                            self.advance()
-                            self.expect_word("payload")
-                            payload_expr = self.parse_factor()
-                            self.expect_word("to")
-                            self.expect_word("url")
-                            url_expr = self.parse_factor()
-                            return HttpPostExpr(url_expr, payload_expr, line)
-                        elif self.word_is("mapping"):
-                            # "the result of mapping F over L"
-                            self.advance()
-                            func_expr = self.parse_factor()
-                            self.expect_word("over")
-                            list_expr = self.parse_factor()
-                            return MapExpr(func_expr, list_expr, line)
-                        elif self.word_is("filtering"):
-                            # "the result of filtering L where CONDITION"
-                            # The condition uses "item" as the implicit loop variable
-                            self.advance()
-                            list_expr = self.parse_factor()
-                            self.expect_word("where")
-                            cond = self.parse_condition()
-                            return FilterExpr(list_expr, "item", cond, line)
-                        elif self.word_is("matching"):
-                            # "the result of matching pattern P in T"
-                            self.advance()
-                            self.expect_word("pattern")
-                            pattern_expr = self.parse_factor()
-                            self.expect_word("in")
-                            text_expr = self.parse_factor()
-                            return RegexMatchExpr(pattern_expr, text_expr, line)
-                    self.pos -= 2 # rollback
-                else:
-                    # General property access: the age of p
-                    # We expect "the [prop] of [obj]"
-                    # Try to parse it:
-                    saved = self.pos
-                    self.advance() # "the"
-                    prop_tok = self.advance() # [prop]
-                    if prop_tok.type == WORD and self.word_is("of"):
-                        self.advance() # "of"
-                        # Special case: don't accidentally capture "the ... of file" if handled above
-                        # Actually we are in the 'else' of the special ones, so it's safe.
-                        obj_expr = self.parse_factor()
-                        return PropertyAccessExpr(obj_expr, prop_tok.value, line)
-                    else:
-                        self.pos = saved # rollback "the"
-
-            # bare "keys of D"
-            if val == "keys":
-                self.advance()
-                self.expect_word("of")
-                dict_expr = self.parse_factor()
-                return DictKeys(dict_expr, line)
-            # 'the' NOT followed by 'length' → falls through to multi-word string
-
-            # "substring of text from A to B"
-            if val == "substring":
-                saved = self.pos
-                self.advance()
-                if self.word_is("of"):
-                    self.advance()
-                    text_expr = self.parse_factor()
-                    self.expect_word("from")
-                    start_expr = self.parse_factor()
-                    self.expect_word("to")
-                    end_expr = self.parse_factor()
-                    return StringSliceExpr(text_expr, start_expr, end_expr, line)
-                self.pos = saved
-                self.advance()
-                return Identifier("substring", line)
+    def _result_of_matching(self, line: int) -> RegexMatchExpr:
+        # "the result of matching pattern P in T"
+        self.expect_word("pattern")
+        pattern_expr = self.parse_factor()
+        self.expect_word("in")
+        text_expr = self.parse_factor()
+        return RegexMatchExpr(pattern_expr, text_expr, line)
 
-            # "character N of text"
-            if val == "character":
-                saved = self.pos
+    def _factor_keys(self, line: int) -> DictKeys:
+        # bare "keys of D"
+        self.advance()
+        self.expect_word("of")
+        dict_expr = self.parse_factor()
+        return DictKeys(dict_expr, line)
+
+    def _factor_substring(self, line: int) -> Any:
+        # "substring of text from A to B"; without "of" it is a plain name.
+        pos = self.pos
+        if self._words[pos + 1] == "of":
+            self.pos = pos + 2
+            text_expr = self.parse_factor()
+            self.expect_word("from")
+            start_expr = self.parse_factor()
+            self.expect_word("to")
+            end_expr = self.parse_factor()
+            return StringSliceExpr(text_expr, start_expr, end_expr, line)
+        self.pos = pos + 1
+        return Identifier("substring", line)
+
+    def _factor_character(self, line: int) -> Any:
+        # "character N of text". The index is only parsed when the next
+        # token could start one; otherwise "character" is a plain name.
+        pos = self.pos
+        nxt = pos + 1
+        if self._types[nxt] in (NUMBER, WORD) and self._words[nxt] not in _INDEX_STOP:
+            self.pos = nxt
+            index_expr = self.parse_factor()
+            if self.word_is("of"):
                 self.advance()
-                if self.current().type in (NUMBER, WORD) and not self.word_is("is", "equals", "has", "and", "or", "plus", "minus", "times", "divided", "modulo"):
-                    index_expr = self.parse_factor()
-                    if self.word_is("of"):
-                        self.advance()
-                        text_expr = self.parse_factor()
-                        return StringIndexExpr(text_expr, index_expr, line)
-                self.pos = saved
+                text_expr = self.parse_factor()
+                return StringIndexExpr(text_expr, index_expr, line)
+        self.pos = nxt
+        return Identifier("character", line)
+
+    def _factor_item(self, line: int) -> Any:
+        # "item N of myList" — or treat as bare identifier if no "of" follows
+        pos = self.pos
+        nxt = pos + 1
+        if self._types[nxt] in (NUMBER, WORD) and self._words[nxt] not in _INDEX_STOP:
+            self.pos = nxt
+            index = self.parse_factor()
+            if self.word_is("of"):
                 self.advance()
-                return Identifier("character", line)
+                list_tok = self.advance()
+                if list_tok.type != WORD:
+                    raise ParseError(line, "Expected list name after 'of'.")
+                return ListAccess(Identifier(list_tok.value, line), index, line)
+        # Rollback — treat "item" as a prose identifier
+        self.pos = nxt
+        return Identifier("item", line)
+
+    def _factor_uppercase(self, line: int) -> Any:
+        # "uppercase of X"
+        self.advance()
+        self.expect_word("of")
+        expr = self.parse_factor()
+        return _fold_text(UppercaseOf, str.upper, expr, line)
 
-            # "item N of myList" — or treat as bare identifier if no "of" follows
-            if val == "item":
-                saved = self.pos
-                self.advance()
-                if self.current().type in (NUMBER, WORD) and not self.word_is("is", "equals", "has", "and", "or", "plus", "minus", "times", "divided", "modulo"):
-                    index = self.parse_factor()
-                    if self.word_is("of"):
-                        self.advance()
-                        list_tok = self.advance()
-                        if list_tok.type != WORD:
-                            raise ParseError(f"Line {line}: Expected list name after 'of'.")
-                        return ListAccess(Identifier(list_tok.value, line), index, line)
-                # Rollback — treat "item" as a prose identifier
-                self.pos = saved
-                self.advance()
-                return Identifier("item", line)
+    def _factor_lowercase(self, line: int) -> Any:
+        # "lowercase of X"
+        self.advance()
+        self.expect_word("of")
+        expr = self.parse_factor()
+        return _fold_text(LowercaseOf, str.lower, expr, line)
 
-            # "uppercase of X"
-            if val == "uppercase":
-                self.advance()
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return UppercaseOf(expr, line)
+    def _factor_trim(self, line: int) -> Any:
+        # "trim X"
+        self.advance()
+        expr = self.parse_factor()
+        return _fold_text(TrimOf, str.strip, expr, line)
 
-            # "lowercase of X"
-            if val == "lowercase":
-                self.advance()
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return LowercaseOf(expr, line)
+    def _factor_split(self, line: int) -> SplitBy:
+        # "split X by Y"
+        self.advance()
+        source = self.parse_factor()
+        self.expect_word("by")
+        delim = self.parse_factor()
+        return SplitBy(source, delim, line)
 
-            # ── Phase 3 expression keywords ───────────────────────────────────
+    def _factor_join(self, line: int) -> JoinWith:
+        # "join X with Y"
+        self.advance()
+        lst = self.parse_factor()
+        self.expect_word("with")
+        sep = self.parse_factor()
+        return JoinWith(lst, sep, line)
 
-            # "trim X"
-            if val == "trim":
-                self.advance()
-                expr = self.parse_factor()
-                return TrimOf(expr, line)
+    def _factor_replace(self, line: int) -> ReplaceIn:
+        # "replace Y in X with Z"
+        self.advance()
+        find = self.parse_factor()
+        self.expect_word("in")
+        source = self.parse_factor()
+        self.expect_word("with")
+        repl = self.parse_factor()
+        return ReplaceIn(source, find, repl, line)
 
-            # "split X by Y"
-            if val == "split":
+    def _factor_round(self, line: int) -> RoundOf:
+        # "round X" or "round X to N places"
+        self.advance()
+        expr = self.parse_factor()
+        if self.word_is("to"):
+            self.advance()
+            places = self.parse_factor()
+            if self.word_is("places") or self.word_is("place"):
                 self.advance()
-                source = self.parse_factor()
-                self.expect_word("by")
-                delim = self.parse_factor()
-                return SplitBy(source, delim, line)
+            return RoundOf(expr, places, line)
+        return RoundOf(expr, None, line)
 
-            # "join X with Y"
-            if val == "join":
-                self.advance()
-                lst = self.parse_factor()
-                self.expect_word("with")
-                sep = self.parse_factor()
-                return JoinWith(lst, sep, line)
+    def _factor_absolute(self, line: int) -> Any:
+        # "absolute value of X"
+        self.advance()
+        self.expect_words("value", "of")
+        expr = self.parse_factor()
+        return _fold_unary(AbsOf, abs, expr, line)
 
-            # "replace Y in X with Z"
-            if val == "replace":
-                self.advance()
-                find = self.parse_factor()
-                self.expect_word("in")
-                source = self.parse_factor()
-                self.expect_word("with")
-                repl = self.parse_factor()
-                return ReplaceIn(source, find, repl, line)
-
-            # "round X" or "round X to N places"
-            if val == "round":
-                self.advance()
-                expr = self.parse_factor()
-                if self.word_is("to"):
-                    self.advance()
-                    places = self.parse_factor()
-                    if self.word_is("places") or self.word_is("place"):
-                        self.advance()
-                    return RoundOf(expr, places, line)
-                return RoundOf(expr, None, line)
+    def _factor_square(self, line: int) -> SqrtOf:
+        # "square root of X"
+        self.advance()
+        self.expect_words("root", "of")
+        expr = self.parse_factor()
+        return SqrtOf(expr, line)
 
-            # "absolute value of X"
-            if val == "absolute":
-                self.advance()
-                self.expect_word("value")
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return AbsOf(expr, line)
+    def _factor_floor(self, line: int) -> Any:
+        # "floor of X"
+        self.advance()
+        self.expect_word("of")
+        expr = self.parse_factor()
+        return _fold_unary(FloorOf, math.floor, expr, line)
 
-            # "square root of X"
-            if val == "square":
-                self.advance()
-                self.expect_word("root")
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return SqrtOf(expr, line)
+    def _factor_ceiling(self, line: int) -> Any:
+        # "ceiling of X"
+        self.advance()
+        self.expect_word("of")
+        expr = self.parse_factor()
+        return _fold_unary(CeilingOf, math.ceil, expr, line)
 
-            # "floor of X"
-            if val == "floor":
-                self.advance()
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return FloorOf(expr, line)
+    def _factor_random(self, line: int) -> RandomBetween:
+        # "random number between A and B"
+        self.advance()
+        self.expect_words("number", "between")
+        low = self.parse_factor()
+        self.expect_word("and")
+        high = self.parse_factor()
+        return RandomBetween(low, high, line)
 
-            # "ceiling of X"
-            if val == "ceiling":
-                self.advance()
-                self.expect_word("of")
-                expr = self.parse_factor()
-                return CeilingOf(expr, line)
+    def _factor_minimum(self, line: int) -> Any:
+        # "minimum of A and B" / "maximum of A and B"
+        self.advance()
+        self.expect_word("of")
+        a = self.parse_factor()
+        self.expect_word("and")
+        b = self.parse_factor()
+        return _fold_binary(MinOf, min, a, b, line)
 
-            # "random number between A and B"
-            if val == "random":
-                self.advance()
-                self.expect_word("number")
-                self.expect_word("between")
-                low = self.parse_factor()
-                self.expect_word("and")
-                high = self.parse_factor()
-                return RandomBetween(low, high, line)
-
-            # "minimum of A and B" / "maximum of A and B"
-            if val == "minimum":
-                self.advance()
-                self.expect_word("of")
-                a = self.parse_factor()
-                self.expect_word("and")
-                b = self.parse_factor()
-                return MinOf(a, b, line)
+    def _factor_maximum(self, line: int) -> Any:
+        self.advance()
+        self.expect_word("of")
+        a = self.parse_factor()
+        self.expect_word("and")
+        b = self.parse_factor()
+        return _fold_binary(MaxOf, max, a, b, line)
 
-            if val == "maximum":
-                self.advance()
-                self.expect_word("of")
-                a = self.parse_factor()
-                self.expect_word("and")
-                b = self.parse_factor()
-                return MaxOf(a, b, line)
-
-            # "X to the power of N" — handled as BinOp during word-collecting
-            # but we also support "power of X to N" as prefix form:
-            if val == "power":
-                self.advance()
-                self.expect_word("of")
-                base = self.parse_factor()
-                self.expect_word("to")
-                exp = self.parse_factor()
-                return PowerOf(base, exp, line)
-
-            # "index of X in myList"
-            if val == "index":
-                self.advance()
-                self.expect_word("of")
-                item = self.parse_factor()
-                self.expect_word("in")
-                lst = self.parse_factor()
-                return IndexOf(item, lst, line)
-
-            # "repeat X N times"
-            if val == "repeat":
-                self.advance()
-                expr = self.parse_factor()
-                count = self.parse_factor()
-                if self.word_is("times"):
-                    self.advance()
-                return RepeatStr(expr, count, line)
+    def _factor_power(self, line: int) -> PowerOf:
+        # "X to the power of N" — handled as BinOp during word-collecting
+        # but we also support "power of X to N" as prefix form:
+        self.advance()
+        self.expect_word("of")
+        base = self.parse_factor()
+        self.expect_word("to")
+        exp = self.parse_factor()
+        return PowerOf(base, exp, line)
 
-            # "X as a number" / "X as text"
-            # Handled as postfix in parse_expr via a wrapper
-            # Also supported as prefix: "as a number X"
-            if val == "as":
-                self.advance()
-                if self.word_is("a"):
-                    self.advance()
-                type_word = self.advance().value.lower()
-                expr = self.parse_factor()
-                if type_word in ("number", "numbers"):
-                    return AsNumber(expr, line)
-                elif type_word in ("text",):
-                    return AsText(expr, line)
-                else:
-                    raise ParseError(f"Line {line}: After 'as' expected 'a number' or 'text'.")
-
-            # Multi-word string / identifier collection
-            STOP_WORDS = {
-                "plus", "minus", "times", "divided", "modulo", "is", "equals",
-                "then", "do", "following", "end", "otherwise",
-                "and", "or", "with", "that", "does", "takes", "back",
-                "greater", "less", "equal", "not", "than", "to",
-                "result", "of", "calling", "repeat", "while", "if",
-                "give", "define", "call", "ask", "say", "display", "let",
-                "be", "function", "called", "user", "for", "times",
-                "add", "remove", "each", "in", "from", "item", "stop", "skip",
-                "containing", "length", "uppercase", "lowercase", "a", "an",
-                "error", "sort", "split", "join", "replace", "trim", "round",
-                "absolute", "value", "square", "root", "floor", "ceiling",
-                "random", "number", "between", "minimum", "maximum", "power",
-                "index", "by", "places", "place", "contains", "as",
-                "dictionary", "keys", "set", "has", "exists", "json", "parsed",
-                "fetching", "posting", "payload", "url", "class", "method",
-                "properties", "new", "on", "parameters",
-                # Phase 6
-                "over", "where", "extends", "enum", "check", "when", "otherwise",
-                "test", "assert", "run", "tests", "command", "arguments",
-                "environment", "variable", "mapping", "filtering", "matching",
-                "pattern", "gives", "function", "values",
-            }
-
-            words = [tok.value]
+    def _factor_index(self, line: int) -> IndexOf:
+        # "index of X in myList"
+        self.advance()
+        self.expect_word("of")
+        item = self.parse_factor()
+        self.expect_word("in")
+        lst = self.parse_factor()
+        return IndexOf(item, lst, line)
+
+    def _factor_repeat(self, line: int) -> RepeatStr:
+        # "repeat X N times"
+        self.advance()
+        expr = self.parse_factor()
+        count = self.parse_factor()
+        if self.word_is("times"):
             self.advance()
-            while self.current().type == WORD and self.current().value.lower() not in STOP_WORDS:
-                words.append(self.current().value)
-                self.advance()
+        return RepeatStr(expr, count, line)
+
+    def _factor_as(self, line: int) -> Any:
+        # "X as a number" / "X as text"
+        # Handled as postfix in parse_expr via a wrapper
+        # Also supported as prefix: "as a number X"
+        self.advance()
+        if self.word_is("a"):
+            self.advance()
+        type_word = self.advance().value_lower
+        expr = self.parse_factor()
+        if type_word in ("number", "numbers"):
+            return AsNumber(expr, line)
+        elif type_word in ("text",):
+            return AsText(expr, line)
+        else:
+            raise ParseError(line, "After 'as' expected 'a number' or 'text'.")
+
+    def parse_factor(self) -> Any:
+        tokens = self.tokens
+        pos = self.pos
+        tok = tokens[pos]
+        ttype = tok.type
+        line = tok.line
+
+        # ── Unary minus ───────────────────────────────────────────────────────
+        if ttype == MINUS:
+            self.pos = pos + 1
+            operand = self.parse_factor()
+            return UnaryMinus(operand, line)
+
+        # ── Number literal ────────────────────────────────────────────────────
+        if ttype == NUMBER:
+            self.pos = pos + 1
+            node = _SMALL_INTS.get(tok.value)
+            if node is not None:
+                return node
+            return NumberLiteral(float(tok.value), line)
 
-            if len(words) == 1:
-                return Identifier(words[0], line)
-            return StringLiteral(" ".join(words), line)
+        # ── Quoted String literal ─────────────────────────────────────────────
+        if ttype == STRING_QUOTED:
+            self.pos = pos + 1
+            return StringLiteral(tok.value, line)
+
+        # ── Interpolated String ──────────────────────────────────────────────
+        if ttype == INTERP_STRING:
+            self.pos = pos + 1
+            return self._parse_interpolated_string(tok.value, line)
+
+        if ttype == WORD:
+            val = tok.value_lower
+
+            handler = _FACTOR_DISPATCH.get(val)
+            if handler is not None:
+                node = handler(self, line)
+                if node is not None:
+                    return node
+
+            # Enum access: "Color Red"
+            # Check if current word is a known identifier followed by another word
+            # This will be handled at interpret-time by checking if it's an enum
+
+            # Multi-word string / identifier collection (see _STOP_WORDS).
+            # Only the end of the run is tracked; the usual single word
+            # needs no list at all.
+            start = pos
+            pos += 1
+            types = self._types
+            lows = self._words
+            while types[pos] == WORD and lows[pos] not in _STOP_WORDS:
+                pos += 1
+            self.pos = pos
+
+            if pos - start == 1:
+                return Identifier(tok.value, line)
+            return StringLiteral(" ".join([t.value for t in tokens[start:pos]]), line)
 
         raise ParseError(
-            f"Line {line}: I expected a value (number, word, true, false, a list, etc.) "
+            line, "I expected a value (number, word, true, false, a list, etc.) "
             f"but found '{tok.value}'."
         )
 
@@ -2206,24 +1731,19 @@ class Parser:
     def parse_try(self) -> TryCatch:
         line = self.current().line
         self.advance()  # "Try"
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("the", "following")
         self.expect_period()
-        try_body = self.parse_block(["Handle"])
-        self.expect_word("Handle")
-        self.expect_word("error")
+        try_body = self.parse_block(_BLOCK_TRY_ALT_END)
+        self.expect_words("Handle", "error")
         # Optional: "and save it as X"
         error_var = "error"
         if self.word_is("and"):
             self.advance()
-            self.expect_word("save")
-            self.expect_word("it")
-            self.expect_word("as")
+            self.expect_words("save", "it", "as")
             error_var = self.advance().value
         self.expect_period()
-        catch_body = self.parse_block(["End"])
-        self.expect_word("End")
-        self.expect_word("try")
+        catch_body = self.parse_block(_BLOCK_END)
+        self.expect_words("End", "try")
         self.expect_period()
         return TryCatch(try_body, error_var, catch_body, line)
 
@@ -2234,7 +1754,7 @@ class Parser:
         self.advance()  # "Sort"
         list_tok = self.advance()
         if list_tok.type != WORD:
-            raise ParseError(f"Line {line}: Expected a list variable name after 'Sort'.")
+            raise ParseError(line, "Expected a list variable name after 'Sort'.")
         self.expect_period()
         return SortList(list_tok.value, line)
 
@@ -2242,45 +1762,44 @@ class Parser:
 
     def _parse_interpolated_string(self, raw: str, line: int) -> InterpolatedString:
         """Parse a string with {expr} interpolation into parts."""
-        from lexer import Lexer as InnerLexer
+        # Jump between braces with str.find rather than walking the string
+        # one character at a time; text runs are sliced out whole.
         parts = []
+        find = raw.find
         i = 0
-        buf = []
-        while i < len(raw):
-            if raw[i] == '{':
-                # Flush text buffer
-                if buf:
-                    parts.append(StringLiteral("".join(buf), line))
-                    buf = []
-                # Find matching closing brace
-                depth = 1
-                i += 1
-                expr_buf = []
-                while i < len(raw) and depth > 0:
-                    if raw[i] == '{':
-                        depth += 1
-                    elif raw[i] == '}':
-                        depth -= 1
-                        if depth == 0:
-                            break
-                    expr_buf.append(raw[i])
-                    i += 1
-                if depth != 0:
-                    raise ParseError(f"Line {line}: Unclosed '{{' in interpolated string.")
-                i += 1  # skip '}'
-                # Parse the expression
-                expr_str = "".join(expr_buf).strip()
-                if not expr_str:
-                    raise ParseError(f"Line {line}: Empty interpolation {{}} in string.")
-                tokens = InnerLexer(expr_str + ".").tokenize()
-                mini_parser = Parser(tokens)
-                expr_node = mini_parser.parse_expr()
-                parts.append(expr_node)
-            else:
-                buf.append(raw[i])
-                i += 1
-        if buf:
-            parts.append(StringLiteral("".join(buf), line))
+        n = len(raw)
+        while i < n:
+            j = find("{", i)
+            if j < 0:
+                parts.append(StringLiteral(raw[i:], line))
+                break
+            if j > i:
+                parts.append(StringLiteral(raw[i:j], line))
+            # Find matching closing brace
+            depth = 1
+            k = j + 1
+            while depth:
+                close = find("}", k)
+                if close < 0:
+                    raise ParseError(line, "Unclosed '{' in interpolated string.")
+                opening = find("{", k, close)
+                if opening < 0:
+                    depth -= 1
+                    k = close + 1
+                else:
+                    depth += 1
+                    k = opening + 1
+            i = k
+            # Parse the expression
+            expr_str = raw[j + 1:k - 1].strip()
+            if not expr_str:
+                raise ParseError(line, "Empty interpolation {} in string.")
+            expr_node = _INTERP_CACHE.get(expr_str)
+            if expr_node is None:
+                expr_node = _parse_fragment(expr_str)
+                if len(_INTERP_CACHE) < _INTERP_CACHE_SIZE:
+                    _INTERP_CACHE[expr_str] = expr_node
+            parts.append(expr_node)
         return InterpolatedString(parts, line)
 
     def parse_check(self) -> CheckStmt:
@@ -2292,38 +1811,37 @@ class Parser:
 
         cases = []
         otherwise = []
-        while self.current().type != EOF:
-            if self.word_is("End"):
+        while self._types[self.pos] != EOF:
+            if self.word_is("end"):
                 break
-            if self.word_is("When"):
+            if self.word_is("when"):
                 self.advance()  # "When"
                 case_val = self.parse_factor()
                 self.expect(COMMA)
                 # Parse body until next When/Otherwise/End
                 body = []
-                while self.current().type != EOF:
-                    if self.word_is("When", "Otherwise", "End"):
+                while self._types[self.pos] != EOF:
+                    if self.word_in(_CHECK_CASE_END):
                         break
                     stmt = self.parse_statement()
                     if stmt is not None:
                         body.append(stmt)
                 cases.append((case_val, body))
-            elif self.word_is("Otherwise"):
+            elif self.word_is("otherwise"):
                 self.advance()  # "Otherwise"
-                if self.current().type == COMMA:
+                if self._types[self.pos] == COMMA:
                     self.advance()
                 # Parse body until End
-                while self.current().type != EOF:
-                    if self.word_is("End"):
+                while self._types[self.pos] != EOF:
+                    if self.word_is("end"):
                         break
                     stmt = self.parse_statement()
                     if stmt is not None:
                         otherwise.append(stmt)
             else:
-                raise ParseError(f"Line {self.current().line}: Expected 'When', 'Otherwise', or 'End' inside Check block.")
+                raise ParseError(self.current().line, "Expected 'When', 'Otherwise', or 'End' inside Check block.")
 
-        self.expect_word("End")
-        self.expect_word("check")
+        self.expect_words("End", "check")
         self.expect_period()
         return CheckStmt(expr, cases, otherwise, line)
 
@@ -2336,11 +1854,10 @@ class Parser:
             test_name = name_tok.value
             self.advance()
         else:
-            raise ParseError(f"Line {line}: Expected a quoted test name after 'Test'.")
+            raise ParseError(line, "Expected a quoted test name after 'Test'.")
         self.expect_period()
-        body = self.parse_block(["End"])
-        self.expect_word("End")
-        self.expect_word("test")
+        body = self.parse_block(_BLOCK_END)
+        self.expect_words("End", "test")
         self.expect_period()
         return TestBlock(test_name, body, line)
 
@@ -2356,8 +1873,7 @@ class Parser:
         """Run all tests."""
         line = self.current().line
         self.advance()  # "Run"
-        self.expect_word("all")
-        self.expect_word("tests")
+        self.expect_words("all", "tests")
         self.expect_period()
         return RunTestsStmt(line)
 
@@ -2368,8 +1884,7 @@ class Parser:
         line = self.current().line
         self.advance()  # "Run"
         if self.word_is("all"):
-            self.expect_word("all")
-            self.expect_word("tests")
+            self.expect_words("all", "tests")
             self.expect_period()
             return RunTestsStmt(line)
         # Otherwise: "Run <window_expr>."
@@ -2381,16 +1896,12 @@ class Parser:
         """Create a window called X with title "T" and size W by H."""
         line = self.current().line
         self.advance()  # "Create"
-        self.expect_word("a")
-        self.expect_word("window")
-        self.expect_word("called")
+        self.expect_words("a", "window", "called")
         name_tok = self.advance()
         var_name = name_tok.value
-        self.expect_word("with")
-        self.expect_word("title")
+        self.expect_words("with", "title")
         title_expr = self.parse_factor()
-        self.expect_word("and")
-        self.expect_word("size")
+        self.expect_words("and", "size")
         width_expr = self.parse_factor()
         self.expect_word("by")
         height_expr = self.parse_factor()
@@ -2401,15 +1912,11 @@ class Parser:
         """Dispatch between list 'Add X to Y' and GUI 'Add a/an button/label/input ...'"""
         line = self.current().line
         # Peek: is it a GUI widget? (handles both 'Add a button' and 'Add an input')
-        if self.peek_ahead().type == WORD and self.peek_ahead().value.lower() in ("a", "an"):
-            saved = self.pos
-            self.advance()  # "Add"
-            self.advance()  # "a" or "an"
-            widget_type = self.current().value.lower() if self.current().type == WORD else ""
+        if self.peek_value_lower() in ("a", "an"):
+            widget_type = self.peek_value_lower(2)
             if widget_type in ("button", "label", "input"):
+                self.pos += 2  # "Add", "a"/"an"
                 return self.parse_add_widget(line, widget_type)
-            else:
-                self.pos = saved  # not a GUI widget, restore
         return self.parse_add_to_list()
 
     def parse_add_widget(self, line: int, widget_type: str):
@@ -2464,15 +1971,13 @@ class Parser:
         # Optional inline callback: "that does the following...End button."
         if widget_type == "button" and self.word_is("that"):
             self.advance()  # "that"
-            self.expect_word("does")
-            self.expect_word("the")
-            self.expect_word("following")
+            self.expect_words("does", "the", "following")
             self.expect_period()
-            body = self.parse_block(["End"])
+            body = self.parse_block(_BLOCK_END)
             self.advance()  # "End"
             self.expect_word("button")
             self.expect_period()
-            callback_body = BlockLambda([], body, line)
+            callback_body = BlockLambda([], body, line=line)
         else:
             self.expect_period()
 
@@ -2495,13 +2000,14 @@ class Parser:
         if self.word_is("user"):
             self.advance()  # "user"
             self.expect_word("presses")
-            key_tok = self.advance().value.lower()  # e.g. "Enter", "a"
+            tok = self.advance()  # e.g. "Enter", "a"
+            key_tok = tok.value_lower or tok.value.lower()
             if key_tok == "enter":
                 event = "enter"
             elif key_tok == "escape":
                 event = "escape"
             else:
-                event = f"key:{key_tok}"
+                event = _intern(f"key:{key_tok}")
             if self.word_is("on"):
                 self.advance()
                 w = self.advance()
@@ -2517,11 +2023,9 @@ class Parser:
             self.expect_word("changes")
             event = "change"
 
-        self.expect_word("do")
-        self.expect_word("the")
-        self.expect_word("following")
+        self.expect_words("do", "the", "following")
         self.expect_period()
-        body = self.parse_block(["End"])
+        body = self.parse_block(_BLOCK_END)
         self.advance()  # "End"
         self.expect_word("when")
         self.expect_period()
@@ -2529,7 +2033,143 @@ class Parser:
 
     def expect(self, token_type: str):
         """Expect and consume a specific token type."""
-        if self.current().type != token_type:
-            raise ParseError(f"Line {self.current().line}: Expected '{token_type}' but found '{self.current().value}'.")
+        if self._types[self.pos] != token_type:
+            raise ParseError(self.current().line, f"Expected '{token_type}' but found '{self.current().value}'.")
         return self.advance()
 
+
+def _parse_fragment(text: str) -> Any:
+    """Parse text as one expression, reusing a pooled Lexer and Parser."""
+    if text.isascii() and text.isidentifier() and text.lower() not in _FACTOR_WORDS:
+        # A bare name ("{total}"), the usual case: parse_factor would collect
+        # the single word and stop at the period, so build that Identifier
+        # without a sub-parse.
+        return Identifier(_intern(text), 1)
+    if _FRAGMENT_POOL:
+        lexer, parser = _FRAGMENT_POOL.pop()
+        lexer.reset(text + ".")
+        parser.reset(lexer.tokenize())
+    else:
+        lexer = Lexer(text + ".")
+        parser = Parser(lexer.tokenize())
+    try:
+        return parser.parse_expr()
+    finally:
+        if len(_FRAGMENT_POOL) < _FRAGMENT_POOL_SIZE:
+            _FRAGMENT_POOL.append((lexer, parser))
+
+
+# Statement parsers keyed by the lowercased leading keyword.
+_STMT_DISPATCH = {
+    "let":     Parser.parse_let,
+    "display": Parser.parse_display,
+    "say":     Parser.parse_say,
+    "ask":     Parser.parse_ask,
+    "if":      Parser.parse_if,
+    "repeat":  Parser.parse_repeat,
+    "while":   Parser.parse_while,
+    "for":     Parser.parse_for_each,
+    "define":  Parser.parse_define,
+    "call":    Parser.parse_call_stmt,
+    "give":    Parser.parse_give_back,
+    "add":     Parser.parse_add_dispatch,
+    "set":     Parser.parse_set_stmt_dispatch,
+    "write":   Parser.parse_write_file,
+    "append":  Parser.parse_append_file,
+    "import":  Parser.parse_import,
+    "throw":   Parser.parse_throw,
+    "attempt": Parser.parse_attempt,
+    "remove":  Parser.parse_remove,
+    "stop":    Parser.parse_stop,
+    "skip":    Parser.parse_skip,
+    "try":     Parser.parse_try,
+    "sort":    Parser.parse_sort_list,
+    # Phase 6
+    "check":   Parser.parse_check,
+    "test":    Parser.parse_test_block,
+    "assert":  Parser.parse_assert,
+    "run":     Parser.parse_run_dispatch,
+    # Phase A — GUI statements
+    "create":  Parser.parse_create_window,
+    # Phase B — Beginner features
+    "when":    Parser.parse_when_stmt,
+}
+
+
+# Factor parsers keyed by the lowercased leading word (see "Factor heads").
+_FACTOR_DISPATCH = {
+    "true":      Parser._factor_true,
+    "false":     Parser._factor_false,
+    "nothing":   Parser._factor_nothing,
+    "empty":     Parser._factor_nothing,
+    "a":         Parser._factor_a,
+    "an":        Parser._factor_a,
+    "waiting":   Parser._factor_waiting,
+    "all":       Parser._factor_all,
+    "the":       Parser._factor_the,
+    "keys":      Parser._factor_keys,
+    "substring": Parser._factor_substring,
+    "character": Parser._factor_character,
+    "item":      Parser._factor_item,
+    "uppercase": Parser._factor_uppercase,
+    "lowercase": Parser._factor_lowercase,
+    "trim":      Parser._factor_trim,
+    "split":     Parser._factor_split,
+    "join":      Parser._factor_join,
+    "replace":   Parser._factor_replace,
+    "round":     Parser._factor_round,
+    "absolute":  Parser._factor_absolute,
+    "square":    Parser._factor_square,
+    "floor":     Parser._factor_floor,
+    "ceiling":   Parser._factor_ceiling,
+    "random":    Parser._factor_random,
+    "minimum":   Parser._factor_minimum,
+    "maximum":   Parser._factor_maximum,
+    "power":     Parser._factor_power,
+    "index":     Parser._factor_index,
+    "repeat":    Parser._factor_repeat,
+    "as":        Parser._factor_as,
+}
+
+# Words that parse_factor treats specially when they start a factor. Any
+# other single word is just an Identifier (parse_arg_list relies on this),
+# so the set is derived from the table rather than kept as a second copy.
+_FACTOR_WORDS = frozenset(_FACTOR_DISPATCH)
+
+# What may follow "a"/"an" at the start of a factor (see _factor_a).
+_ARTICLE_DISPATCH = {
+    "list":       Parser._factor_a_list,
+    "dictionary": Parser._factor_a_dictionary,
+    "new":        Parser._factor_a_new,
+    "function":   Parser._factor_a_function,
+    "empty":      Parser._factor_a_empty,
+}
+
+# What may follow "the" at the start of a factor (see _factor_the).
+_THE_DISPATCH = {
+    "length":      Parser._factor_the_length,
+    "value":       Parser._factor_the_value,
+    "keys":        Parser._factor_the_keys,
+    "contents":    Parser._factor_the_contents,
+    "current":     Parser._factor_the_current,
+    "command":     Parser._factor_the_command,
+    "environment": Parser._factor_the_environment,
+    "json":        Parser._factor_the_json,
+    "result":      Parser._factor_the_result,
+}
+
+# The verb after "the result of" (see _factor_the_result).
+_RESULT_OF_DISPATCH = {
+    "fetching":  Parser._result_of_fetching,
+    "posting":   Parser._result_of_posting,
+    "mapping":   Parser._result_of_mapping,
+    "filtering": Parser._result_of_filtering,
+    "matching":  Parser._result_of_matching,
+}
+
+# What follows "Define a/an", other than "function" (see parse_define).
+_DEFINE_DISPATCH = {
+    "class":  Parser.parse_class_def,
+    "method": Parser.parse_method_def,
+    "enum":   Parser.parse_enum_def,
+}
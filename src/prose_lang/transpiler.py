@@ -387,8 +387,8 @@ class Transpiler:
         t = type(node).__name__
 
         if t == "CompoundCondition":
-            op = "and" if node.connective == "and" else "or"
-            return f"({self._cond(node.left)} {op} {self._cond(node.right)})"
+            op = " and " if node.connective == "and" else " or "
+            return "(" + op.join(self._cond(o) for o in node.operands) + ")"
 
         if t == "Condition":
             left = self._expr(node.left)
@@ -1,7 +1,8 @@
-from lexer import Lexer
-with open("samples/sample25.prose") as f:
-    text = f.read()
-line17 = text.split("\n")[16]
-l = Lexer(line17)
-for t in l.tokenize():
-    print(t)
+if __name__ == "__main__":
+    from itertools import islice
+    from lexer import Lexer
+    with open("samples/sample25.prose") as f:
+        line17 = next(islice(f, 16, 17)).rstrip("\n")
+    l = Lexer(line17)
+    for t in l.tokenize():
+        print(t)
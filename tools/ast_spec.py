@@ -0,0 +1,575 @@
+"""
+AST node specification for the prose parser.
+
+This is the source of truth for the node classes. It is not imported at
+runtime: tools/gen_ast_nodes.py reads these dataclasses and writes plain
+classes with hand-rolled __init__/__repr__/__eq__ to
+src/prose_lang/_ast_nodes.py, so importing the parser does not pay for
+running the dataclass code generator on every node.
+
+After editing this file, regenerate with:
+
+    python tools/gen_ast_nodes.py
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import List, Optional, Any
+
+
+# ─── AST Nodes ─────────────────────────────────────────────────────────────────
+
+# Every node carries its source line. It is keyword-only so that subclasses
+# can keep declaring required fields after it (kw_only needs Python 3.10 to
+# run the generator; the generated classes themselves work on 3.9).
+@dataclass
+class _Node:
+    line: int = field(default=0, kw_only=True)
+
+@dataclass
+class NumberLiteral(_Node):
+    value: float
+
+@dataclass
+class StringLiteral(_Node):
+    value: str
+
+@dataclass
+class BoolLiteral(_Node):
+    value: bool
+
+@dataclass
+class NoneLiteral(_Node):
+    pass
+
+@dataclass
+class LiteralNode(_Node):
+    value: Any
+
+@dataclass
+class Identifier(_Node):
+    name: str
+
+@dataclass
+class BinOp(_Node):
+    left: Any
+    op: str    # plus, minus, times, divided_by, modulo
+    right: Any
+
+@dataclass
+class UnaryMinus(_Node):
+    operand: Any
+
+# Compound condition: operand (and|or) operand (and|or) ...
+@dataclass
+class CompoundCondition(_Node):
+    connective: str      # "and" | "or"
+    operands: List[Any]  # two or more Condition / CompoundCondition nodes
+
+@dataclass
+class Condition(_Node):
+    left: Any
+    op: str   # greater_than, less_than, equals, not_equals, greater_equal, less_equal,
+              # is_number, is_text, is_list, is_boolean
+    right: Any  # None for type-check ops
+
+@dataclass
+class ListLiteral(_Node):
+    elements: List[Any]
+
+@dataclass
+class ListAccess(_Node):
+    list_expr: Any
+    index_expr: Any   # 1-based
+
+@dataclass
+class LengthOf(_Node):
+    expr: Any
+
+@dataclass
+class UppercaseOf(_Node):
+    expr: Any
+
+@dataclass
+class LowercaseOf(_Node):
+    expr: Any
+
+@dataclass
+class ContainsExpr(_Node):
+    """X contains Y → bool"""
+    haystack: Any
+    needle: Any
+
+@dataclass
+class JoinWith(_Node):
+    list_expr: Any
+    separator: Any
+
+@dataclass
+class TypeCheck(_Node):
+    expr: Any
+    expected: str
+
+# ── Phase 3 string nodes ────────────────────────────────────────────────────────
+
+@dataclass
+class ReplaceIn(_Node):
+    """replace Y in X with Z"""
+    source: Any   # the string to operate on
+    find: Any     # what to find
+    replacement: Any
+
+@dataclass
+class SplitBy(_Node):
+    """split X by Y → list"""
+    source: Any
+    delimiter: Any
+
+@dataclass
+class TrimOf(_Node):
+    """trim X → removes leading/trailing whitespace"""
+    expr: Any
+
+@dataclass
+class RepeatStr(_Node):
+    """repeat X N times → string"""
+    expr: Any
+    count: Any
+
+@dataclass
+class ListContainsExpr(_Node):
+    """myList contains X → bool"""
+    list_expr: Any
+    item: Any
+
+@dataclass
+class SortList(_Node):
+    """sort myList (in place)"""
+    list_name: str
+
+@dataclass
+class IndexOf(_Node):
+    """index of X in myList → number (1-based, 0 if not found)"""
+    item: Any
+    list_expr: Any
+
+# ── Phase 3 math nodes ──────────────────────────────────────────────────────────
+
+@dataclass
+class RoundOf(_Node):
+    expr: Any
+    places: Any   # None = round to integer
+
+@dataclass
+class AbsOf(_Node):
+    expr: Any
+
+@dataclass
+class RandomBetween(_Node):
+    low: Any
+    high: Any
+
+@dataclass
+class MinOf(_Node):
+    left: Any
+    right: Any
+
+@dataclass
+class MaxOf(_Node):
+    left: Any
+    right: Any
+
+@dataclass
+class SqrtOf(_Node):
+    expr: Any
+
+@dataclass
+class FloorOf(_Node):
+    expr: Any
+
+@dataclass
+class CeilingOf(_Node):
+    expr: Any
+
+@dataclass
+class PowerOf(_Node):
+    base: Any
+    exp: Any
+
+# ── Phase 3 conversion nodes ────────────────────────────────────────────────────
+
+@dataclass
+class AsNumber(_Node):
+    expr: Any
+
+@dataclass
+class AsText(_Node):
+    expr: Any
+
+# ── Phase 3 error handling ──────────────────────────────────────────────────────
+
+@dataclass
+class TryCatch(_Node):
+    try_body: List[Any]
+    error_var: str          # variable name that gets the error message
+    catch_body: List[Any]
+
+# ── Phase 4 Dictionary nodes ───────────────────────────────────────────────────
+
+@dataclass
+class DictLiteral(_Node):
+    pairs: List[tuple[Any, Any]]
+
+@dataclass
+class DictAccess(_Node):
+    dict_expr: Any
+    key_expr: Any
+
+@dataclass
+class DictHasKey(_Node):
+    dict_expr: Any
+    key_expr: Any
+
+@dataclass
+class DictKeys(_Node):
+    dict_expr: Any
+
+@dataclass
+class SetDictValueStmt(_Node):
+    dict_expr: Any
+    key_expr: Any
+    value_expr: Any
+
+@dataclass
+class RemoveDictValueStmt(_Node):
+    dict_expr: Any
+    key_expr: Any
+
+# ── Phase 4 File I/O & Module nodes ───────────────────────────────────────────
+
+@dataclass
+class FileContents(_Node):
+    file_expr: Any
+
+@dataclass
+class FileExists(_Node):
+    file_expr: Any
+
+@dataclass
+class WriteFileStmt(_Node):
+    content_expr: Any
+    file_expr: Any
+
+@dataclass
+class AppendFileStmt(_Node):
+    content_expr: Any
+    file_expr: Any
+
+@dataclass
+class ImportStmt(_Node):
+    file_expr: Any
+    alias: Optional[str] = None
+    specific_imports: Optional[List[str]] = None
+
+@dataclass
+class ThrowStmt(_Node):
+    msg_expr: Any
+
+# ── Phase 5 ────────────────────────────────────────────────────────────────
+@dataclass
+class JsonParseExpr(_Node):
+    text_expr: Any
+
+@dataclass
+class JsonStringifyExpr(_Node):
+    dict_expr: Any
+
+@dataclass
+class ParamDef:
+    name: str
+    default_expr: Optional[Any] = None
+
+@dataclass
+class HttpGetExpr(_Node):
+    url_expr: Any
+
+@dataclass
+class HttpPostExpr(_Node):
+    url_expr: Any
+    payload_expr: Any
+
+@dataclass
+class ClassDef(_Node):
+    name: str
+    properties: List[str]
+    parent: Optional[str] = None
+
+@dataclass
+class MethodDef(_Node):
+    class_name: str
+    name: str
+    params: List[ParamDef]
+    body: List[Any]
+
+@dataclass
+class NewInstanceExpr(_Node):
+    class_name: str
+    args: List[tuple[str, Any]]  # (prop_name, expr)
+
+@dataclass
+class PropertyAccessExpr(_Node):
+    obj_expr: Any
+    prop_name: str
+
+@dataclass
+class SetPropertyStmt(_Node):
+    obj_expr: Any
+    prop_name: str
+    value_expr: Any
+
+@dataclass
+class MethodCallStmt(_Node):
+    obj_expr: Any
+    method_name: str
+    args: List[Any]
+
+@dataclass
+class TimeOp(_Node):
+    op_type: str  # "datetime", "year", "timestamp"
+
+# ── Phase 6 ────────────────────────────────────────────────────────────────────────
+@dataclass
+class InterpolatedString(_Node):
+    parts: List[Any]  # list of StringLiteral and expression nodes
+
+@dataclass
+class CheckStmt(_Node):
+    expr: Any
+    cases: List[tuple]  # [(value_expr, body_stmts), ...]
+    otherwise: List[Any]
+
+@dataclass
+class LambdaExpr(_Node):
+    params: List[ParamDef]
+    body_expr: Any
+
+@dataclass
+class BlockLambda(_Node):
+    """Multi-line inline function: a function that takes X and does the following...End function."""
+    params: List[ParamDef]
+    body: List[Any]
+
+    # Fields to match FunctionDef interface so _call_function can work with it
+    name: str = "<inline>"
+    is_async: bool = False
+
+@dataclass
+class MapExpr(_Node):
+    func_expr: Any
+    list_expr: Any
+
+@dataclass
+class FilterExpr(_Node):
+    list_expr: Any
+    var_name: str
+    condition: Any
+
+@dataclass
+class EnumDef(_Node):
+    name: str
+    values: List[str]
+
+# ── Phase 8 ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class AttemptStmt(_Node):
+    try_body: List[Any]
+    error_var: str
+    catch_body: List[Any]
+
+@dataclass
+class WaitExpr(_Node):
+    expr: Any
+
+# ── Phase B — Beginner Power Features ────────────────────────────────────
+
+@dataclass
+class RangeLoopStmt(_Node):
+    var_name: str        # loop variable
+    from_expr: Any       # start value
+    to_expr: Any         # end value (inclusive)
+    step_expr: Any       # step (None = 1)
+    body: List[Any]
+
+@dataclass
+class AllWhereExpr(_Node):
+    var_name: str        # iteration variable
+    source_expr: Any     # the list to filter
+    condition: Any       # filter condition (uses var_name)
+
+@dataclass
+class WhenStmt(_Node):
+    event: str           # "enter", "closes", "click"
+    widget_expr: Any     # widget to bind (None for window events)
+    body: List[Any]
+
+# ── Phase A — High-Level GUI ──────────────────────────────────────────────────
+
+@dataclass
+class CreateWindowStmt(_Node):
+    var_name: str        # variable to bind the window to
+    title_expr: Any
+    width_expr: Any
+    height_expr: Any
+
+@dataclass
+class AddWidgetStmt(_Node):
+    widget_type: str     # "button", "label", "input"
+    window_expr: Any
+    label_expr: Any      # text/label (None for input)
+    var_name: str        # binding name (optional for button/label, required for input)
+    callback_body: Any   # BlockLambda / FunctionDef ref for buttons (None for others)
+    row_expr: Any        # grid row (optional)
+    col_expr: Any        # grid col (optional)
+    colspan_expr: Any    # colspan (optional)
+
+@dataclass
+class RunWindowStmt(_Node):
+    window_expr: Any
+
+@dataclass
+class SetTextStmt(_Node):
+    widget_expr: Any
+    value_expr: Any
+
+@dataclass
+class EnumAccess(_Node):
+    enum_name: str
+    value_name: str
+
+@dataclass
+class CliArgsExpr(_Node):
+    pass
+
+@dataclass
+class EnvVarExpr(_Node):
+    name_expr: Any
+
+@dataclass
+class TestBlock(_Node):
+    name: str
+    body: List[Any]
+
+@dataclass
+class AssertStmt(_Node):
+    condition: Any
+
+@dataclass
+class RunTestsStmt(_Node):
+    pass
+
+@dataclass
+class RegexMatchExpr(_Node):
+    pattern_expr: Any
+    text_expr: Any
+
+@dataclass
+class RegexTestExpr(_Node):
+    text_expr: Any
+    pattern_expr: Any
+
+@dataclass
+class StringIndexExpr(_Node):
+    str_expr: Any
+    index_expr: Any
+
+@dataclass
+class StringSliceExpr(_Node):
+    str_expr: Any
+    start_expr: Any
+    end_expr: Any
+
+# Statements
+
+@dataclass
+class LetStmt(_Node):
+    name: str
+    expr: Any
+
+@dataclass
+class DisplayStmt(_Node):
+    expr: Any
+
+@dataclass
+class SayStmt(_Node):
+    parts: List[Any]
+
+@dataclass
+class AskStmt(_Node):
+    variable: str
+
+@dataclass
+class IfStmt(_Node):
+    condition: Any      # Condition or CompoundCondition
+    then_body: List[Any]
+    else_body: List[Any] = field(default_factory=list)
+
+@dataclass
+class RepeatStmt(_Node):
+    count: Any          # expression (not just int)
+    body: List[Any]
+
+@dataclass
+class WhileStmt(_Node):
+    condition: Any
+    body: List[Any]
+
+@dataclass
+class ForEachStmt(_Node):
+    var: str
+    iterable: Any
+    body: List[Any]
+
+@dataclass
+class FunctionDef(_Node):
+    name: str
+    params: List[ParamDef]
+    body: List[Any]
+    is_async: bool = False
+
+@dataclass
+class CallStmt(_Node):
+    name: str
+    args: List[Any]
+    obj_expr: Optional[Any] = None
+    chained_calls: Optional[List[tuple[str, List[Any], int]]] = None
+
+@dataclass
+class LetResultStmt(_Node):
+    variable: str
+    func_name: str
+    args: List[Any]
+    obj_expr: Optional[Any] = None
+    chained_calls: Optional[List[tuple[str, List[Any], int]]] = None
+
+@dataclass
+class GiveBackStmt(_Node):
+    expr: Any
+
+@dataclass
+class AddToListStmt(_Node):
+    value: Any
+    list_name: str
+
+@dataclass
+class RemoveFromListStmt(_Node):
+    index: Any
+    list_name: str
+
+@dataclass
+class StopStmt(_Node):
+    pass
+
+@dataclass
+class SkipStmt(_Node):
+    pass
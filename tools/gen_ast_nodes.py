@@ -0,0 +1,154 @@
+"""
+Generate src/prose_lang/_ast_nodes.py from tools/ast_spec.py.
+
+The spec declares every AST node as a @dataclass. Running @dataclass on
+~100 classes at import time costs tens of milliseconds (each one execs
+generated source), so this script does that work once and writes out
+equivalent plain classes: same constructor parameters, same repr, same
+field-wise equality, same node_kind numbering. Every class gets __slots__,
+so nodes carry no per-instance __dict__.
+
+Keyword-only fields (the line every node carries) are emitted as ordinary
+trailing parameters, so the parser can pass them positionally: binding a
+keyword argument costs noticeably more than a positional one, and nodes
+are built by the thousand.
+
+Usage:
+    python tools/gen_ast_nodes.py          # rewrite _ast_nodes.py
+    python tools/gen_ast_nodes.py --check  # exit 1 if it is out of date
+"""
+
+from __future__ import annotations
+import dataclasses
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUT_PATH = os.path.join(HERE, os.pardir, "src", "prose_lang", "_ast_nodes.py")
+
+sys.path.insert(0, HERE)
+import ast_spec  # noqa: E402
+
+
+HEADER = '''\
+# Generated by tools/gen_ast_nodes.py from tools/ast_spec.py — do not edit.
+"""
+prose AST node classes.
+
+Plain classes equivalent to the @dataclass declarations in
+tools/ast_spec.py, written out ahead of time so importing the parser does
+not run the dataclass code generator.
+"""
+
+from __future__ import annotations
+from typing import Any, List, Optional
+{all}
+
+class _Record:
+    """Field-wise repr and equality over _fields, as @dataclass provides."""
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __repr__(self):
+        args = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__qualname__}({args})"
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return (tuple(getattr(self, f) for f in self._fields)
+                    == tuple(getattr(other, f) for f in other._fields))
+        return NotImplemented
+
+
+class _Node(_Record):
+    """Base of every AST node; node_kind indexes NODE_TYPES."""
+    __slots__ = ("line",)
+    node_kind: int = -1
+'''
+
+
+# Literal spelling for the usual default factories.
+_EMPTY = {list: "[]", dict: "{}"}
+
+
+def _spec_classes() -> list:
+    """Dataclasses declared in the spec, in definition order."""
+    return [
+        obj for obj in vars(ast_spec).values()
+        if isinstance(obj, type) and dataclasses.is_dataclass(obj)
+        and obj.__module__ == ast_spec.__name__ and obj is not ast_spec._Node
+    ]
+
+
+def _param(f: dataclasses.Field) -> str:
+    if f.default is not dataclasses.MISSING:
+        return f"{f.name}: {f.type} = {f.default!r}"
+    if f.default_factory is not dataclasses.MISSING:
+        # A fresh value per instance, like field(default_factory=...).
+        return f"{f.name}: {f.type} = None"
+    return f"{f.name}: {f.type}"
+
+
+def _emit_class(cls: type, kind: int) -> str:
+    fields = dataclasses.fields(cls)
+    positional = [f for f in fields if not f.kw_only]
+    keyword = [f for f in fields if f.kw_only]
+    is_node = issubclass(cls, ast_spec._Node)
+
+    params = ["self"] + [_param(f) for f in positional] + [_param(f) for f in keyword]
+
+    out = [f"class {cls.__name__}({'_Node' if is_node else '_Record'}):"]
+    if is_node:
+        out.append(f"    node_kind = {kind}")
+    own = tuple(f.name for f in fields if not (is_node and f.name == "line"))
+    out.append(f"    __slots__ = {own!r}")
+    out.append(f"    _fields = {tuple(f.name for f in fields)!r}")
+    out.append(f"    __match_args__ = {tuple(f.name for f in positional)!r}")
+    out.append("")
+    out.append(f"    def __init__({', '.join(params)}):")
+    for f in fields:
+        if f.default_factory is not dataclasses.MISSING:
+            empty = _EMPTY.get(f.default_factory, f"{f.default_factory.__name__}()")
+            out.append(f"        self.{f.name} = {empty} if {f.name} is None else {f.name}")
+        else:
+            out.append(f"        self.{f.name} = {f.name}")
+    return "\n".join(out) + "\n"
+
+
+def generate() -> str:
+    classes = _spec_classes()
+    names = [cls.__name__ for cls in classes] + ["NODE_TYPES"]
+    all_list = "\n__all__ = [\n" + "".join(f"    {name!r},\n" for name in names) + "]\n"
+    parts = [HEADER.replace("{all}", all_list)]
+    node_names = []
+    for cls in classes:
+        kind = len(node_names)
+        parts.append("\n\n" + _emit_class(cls, kind))
+        if issubclass(cls, ast_spec._Node):
+            node_names.append(cls.__name__)
+    parts.append("\n\n# Every node class, indexed by its node_kind.\n")
+    parts.append("NODE_TYPES: List[type] = [\n")
+    parts.extend(f"    {name},\n" for name in node_names)
+    parts.append("]\n")
+    return "".join(parts)
+
+
+def main(argv: list) -> int:
+    source = generate()
+    if "--check" in argv:
+        try:
+            with open(OUT_PATH, encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print("_ast_nodes.py is out of date; run: python tools/gen_ast_nodes.py")
+            return 1
+        return 0
+    with open(OUT_PATH, "w", encoding="utf-8") as f:
+        f.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))